@@ -3,7 +3,12 @@
 import tkinter as tk  # GUI toolkit
 from tkinter import ttk, filedialog, messagebox  # widgets and dialogs
 from pathlib import Path  # FS paths
-from typing import Dict, List  # typing
+from typing import Dict, List, Tuple  # typing
+import itertools  # chain peeked table
+import os  # cpu count
+import queue  # worker → UI messages
+import threading  # background run
+import time  # progress throttling
 
 HeaderPattern = ["COLUMN 1", "COLUMN 2", "...", "COLUMN N"]  # header pattern 
 
@@ -19,12 +24,26 @@ class App(tk.Tk):
         self.CsvVar = tk.BooleanVar(value=True)  # export CSV flag 
         self.SqlVar = tk.BooleanVar(value=True)  # export SQL flag 
         self.StopOnEmptyRowVar = tk.BooleanVar(value=True)  # stop on empty row flag 
+        self.StreamingVar = tk.BooleanVar(value=False)  # read-only streaming extraction flag 
+        self.FillMergedVar = tk.BooleanVar(value=False)  # fill merged cells down into rows flag 
+        self.WorkersVar = tk.IntVar(value=1)  # extraction processes (1 = serial) 
+        self.JsonLayoutVar = tk.StringVar(value="indented")  # JSON layout: indented / compact / ndjson 
+        self.CacheVar = tk.BooleanVar(value=True)  # incremental re-run cache flag 
+        self.TimingVar = tk.BooleanVar(value=False)  # write timings.json next to the outputs 
+        self.ProfileVar = tk.BooleanVar(value=False)  # capture a cProfile profile.prof for this run 
         self.HeaderPatternVar = tk.StringVar(value=", ".join(HeaderPattern))  # header pattern
+        from session_module import WorkbookSession  # lazy import 
+        self.Session = WorkbookSession()  # parsed sheets shared by Load Sheets and Run 
 
         self.Sheets: List[str] = []  # available sheet names 
         self.SheetListVar = tk.Variable(value=self.Sheets)  # listbox var 
         self.SchemaBySheet: Dict[str, tk.StringVar] = {}  # per-sheet schema vars 
 
+        self.Worker = None  # background run thread 
+        self.Messages: "queue.Queue" = queue.Queue()  # worker → UI messages, polled with after() 
+        self.CancelEvent = threading.Event()  # set by Cancel 
+        self.StatusVar = tk.StringVar(value="")  # progress text 
+
         self._BuildUi()  # build UI 
 
     def _BuildUi(self):
@@ -41,9 +60,15 @@ class App(tk.Tk):
         outFrame = ttk.LabelFrame(self, text="Output")  # frame 
         outFrame.pack(fill="x", **pad)  # layout 
         ttk.Checkbutton(outFrame, text="JSON", variable=self.JsonVar).pack(side="left", padx=6, pady=6)  # json flag 
+        ttk.Combobox(outFrame, textvariable=self.JsonLayoutVar, values=("indented", "compact", "ndjson"), state="readonly", width=9).pack(side="left", pady=6)  # json layout 
         ttk.Checkbutton(outFrame, text="CSV", variable=self.CsvVar).pack(side="left", padx=6, pady=6)  # csv flag 
         ttk.Checkbutton(outFrame, text="SQL (DDL)", variable=self.SqlVar).pack(side="left", padx=6, pady=6)  # sql flag 
         ttk.Checkbutton(outFrame, text="Stop on empty row", variable=self.StopOnEmptyRowVar).pack(side="left", padx=6, pady=6)  # stop flag 
+        ttk.Checkbutton(outFrame, text="Low memory (streaming)", variable=self.StreamingVar).pack(side="left", padx=6, pady=6)  # streaming flag 
+        ttk.Checkbutton(outFrame, text="Fill merged cells", variable=self.FillMergedVar).pack(side="left", padx=6, pady=6)  # fill merged flag 
+        ttk.Checkbutton(outFrame, text="Incremental (cache)", variable=self.CacheVar).pack(side="left", padx=6, pady=6)  # cache flag 
+        ttk.Checkbutton(outFrame, text="Timing report", variable=self.TimingVar).pack(side="left", padx=6, pady=6)  # timings flag 
+        ttk.Checkbutton(outFrame, text="Profile", variable=self.ProfileVar).pack(side="left", padx=6, pady=6)  # cProfile flag 
 
         # Output directory #
         outDirFrame = ttk.Frame(outFrame)  # nested frame 
@@ -51,11 +76,13 @@ class App(tk.Tk):
         ttk.Label(outDirFrame, text="Output dir:").pack(side="left")  # label 
         ttk.Entry(outDirFrame, textvariable=self.OutDirVar).pack(side="left", expand=True, fill="x", padx=6)  # path entry 
         ttk.Button(outDirFrame, text="Choose...", command=self._ChooseOutDir).pack(side="left")  # choose dir 
+        ttk.Label(outDirFrame, text="Workers:").pack(side="left", padx=(12, 0))  # label 
+        ttk.Spinbox(outDirFrame, from_=1, to=os.cpu_count() or 1, width=4, textvariable=self.WorkersVar).pack(side="left", padx=6)  # process count 
 
         # Header pattern # 
         patternFrame = ttk.LabelFrame(self, text="Header Pattern (defines table start)")  # frame
         patternFrame.pack(fill="x", **pad)  # layout
-        ttk.Label(patternFrame, text="Set Frame (format: col_name_a, col_name_b, ....): ").pack(side="left", padx=6, pady=6)  # label
+        ttk.Label(patternFrame, text="Set Frame (format: col_name_a, col_name_b, ....; separate several patterns with ';'): ").pack(side="left", padx=6, pady=6)  # label
         ttk.Entry(patternFrame, textvariable=self.HeaderPatternVar).pack(side="left", expand=True, fill="x", padx=6, pady=6)  # entry
 
         # Sheets + schemas #
@@ -83,7 +110,13 @@ class App(tk.Tk):
         # Action buttons #
         actionFrame = ttk.Frame(self)  # bottom actions 
         actionFrame.pack(fill="x", **pad)  # layout 
-        ttk.Button(actionFrame, text="Run", command=self._Run).pack(side="right", padx=6)  # run 
+        self.ProgressBar = ttk.Progressbar(actionFrame, mode="determinate", length=200)  # sheets progress 
+        self.ProgressBar.pack(side="left", padx=6)  # layout 
+        ttk.Label(actionFrame, textvariable=self.StatusVar).pack(side="left", padx=6)  # counters 
+        self.RunButton = ttk.Button(actionFrame, text="Run", command=self._Run)  # run 
+        self.RunButton.pack(side="right", padx=6)  # layout 
+        self.CancelButton = ttk.Button(actionFrame, text="Cancel", command=self._Cancel, state="disabled")  # cancel 
+        self.CancelButton.pack(side="right", padx=6)  # layout 
         ttk.Button(actionFrame, text="Quit", command=self.destroy).pack(side="right", padx=6)  # quit 
 
     def _ChooseExcel(self):
@@ -102,9 +135,7 @@ class App(tk.Tk):
             if not excelPath.exists():
                 messagebox.showerror("Error", "Excel file not found.")  # error 
                 return
-            from openpyxl import load_workbook  # lazy import 
-            wb = load_workbook(excelPath, read_only=True)  # open workbook 
-            self.Sheets = list(wb.sheetnames)  # fetch sheet names 
+            self.Sheets = self.Session.SheetNames(excelPath)  # fetch sheet names, cached until the file changes 
             self.SheetListVar.set(self.Sheets)  # update listbox 
             self._BuildSchemaEntries(self.Sheets)  # build schema entries 
             messagebox.showinfo("Sheets loaded", f"Found {len(self.Sheets)} sheets.")  # info 
@@ -145,6 +176,8 @@ class App(tk.Tk):
         
 
     def _Run(self):
+        if self.Worker is not None and self.Worker.is_alive():
+            return  # run already in progress 
         try:
             excelPath = Path(self.ExcelPathVar.get())  # excel path 
             outDir = Path(self.OutDirVar.get())  # output dir 
@@ -156,29 +189,163 @@ class App(tk.Tk):
             schemaBySheet = self._EffectiveSchemaBySheet(selectedSheets)  # schema map 
 
             if self.HeaderPatternVar.get() is not None or self.HeaderPatternVar.get().strip() != "":
-                HeaderPattern = [s.strip() for s in self.HeaderPatternVar.get().split(",") if s.strip()]  # parse pattern
+                HeaderPatterns = [[s.strip() for s in p.split(",") if s.strip()] for p in self.HeaderPatternVar.get().split(";") if p.strip()]  # parse patterns
+                HeaderPattern = HeaderPatterns[0] if len(HeaderPatterns) == 1 else HeaderPatterns  # single pattern stays a flat list
 
-            from extractor_module import ExtractAllTables, WriteTablesJson, WriteTablesCsv 
-            
-            tables = ExtractAllTables(excelPath, HeaderPattern, sheetsToCheck=set(selectedSheets), stopOnEmptyRow=self.StopOnEmptyRowVar.get())  # parse tables 
-            if not tables:
-                messagebox.showwarning("No tables", "No tables found with the given header pattern.")  # warn 
-                return
-            # Exports #
-            if self.JsonVar.get():
-                from extractor_module import WriteTablesJson
-                WriteTablesJson(tables, outDir / "tables.json")  # write JSON 
-            if self.CsvVar.get():
-                csvDir = outDir / "csv"  # csv folder 
-                from extractor_module import WriteTablesCsv
-                WriteTablesCsv(tables, csvDir)  # write CSVs 
-            if self.SqlVar.get():
-                sqlDir = outDir / "sql"  # sql folder 
-                from ddl_module import WriteAllDdls  # import here to avoid cycles 
-                WriteAllDdls(tables, schemaBySheet, sqlDir)  # write DDLs 
-            messagebox.showinfo("Done", f"Completed.\nOutput: {outDir.resolve()}")  # success 
+            options = {  # snapshot of the UI state: tk variables must not be read from the worker thread 
+                "excelPath": excelPath, "outDir": outDir, "pattern": HeaderPattern,
+                "sheets": set(selectedSheets), "schemaBySheet": schemaBySheet,
+                "json": self.JsonVar.get(), "jsonLayout": self.JsonLayoutVar.get(), "csv": self.CsvVar.get(), "sql": self.SqlVar.get(),
+                "stopOnEmptyRow": self.StopOnEmptyRowVar.get(), "fillMerged": self.FillMergedVar.get(),
+                "streaming": self.StreamingVar.get(), "workers": self.WorkersVar.get(), "cache": self.CacheVar.get(),
+                "timing": self.TimingVar.get(), "profile": self.ProfileVar.get(),
+            }
         except Exception as e:
             messagebox.showerror("Error", str(e))  # error dialog 
+            return
+        self.CancelEvent.clear()  # fresh run 
+        self.ProgressBar.configure(maximum=max(len(selectedSheets), 1), value=0)  # one step per sheet 
+        self.StatusVar.set("Starting...")  # status line 
+        self.RunButton.configure(state="disabled")  # no concurrent runs 
+        self.CancelButton.configure(state="normal")  # allow cancel 
+        target = self._RunInstrumented if options["timing"] or options["profile"] else self._RunWorker  # hooks only when asked 
+        self.Worker = threading.Thread(target=target, args=(options,), daemon=True)  # background run 
+        self.Worker.start()  # go 
+        self.after(100, self._PollQueue)  # start polling 
+
+    def _Cancel(self):
+        self.CancelEvent.set()  # checked between rows/tables 
+        self.StatusVar.set("Cancelling...")  # feedback 
+
+    def _PollQueue(self):
+        finished = False  # worker reported an outcome 
+        try:
+            while True:
+                kind, payload = self.Messages.get_nowait()  # drain queue 
+                if kind == "progress":
+                    self.ProgressBar.configure(value=payload["sheet"])  # sheets scanned 
+                    self.StatusVar.set(f"Sheets: {payload['sheet']}  Tables: {payload['table']}  Rows: {payload['row']}  Files: {payload['file']}")  # counters 
+                    continue
+                finished = True  # outcome message 
+                self.RunButton.configure(state="normal")  # idle again 
+                self.CancelButton.configure(state="disabled")  # nothing to cancel 
+                if kind == "done":
+                    self.StatusVar.set("Completed.")  # status line 
+                    messagebox.showinfo("Done", payload)  # success 
+                elif kind == "warning":
+                    self.StatusVar.set(payload)  # status line 
+                    messagebox.showwarning("No tables", payload)  # warn 
+                elif kind == "cancelled":
+                    self.StatusVar.set("Cancelled.")  # status line 
+                    messagebox.showinfo("Cancelled", payload)  # info 
+                else:
+                    self.StatusVar.set("Failed.")  # status line 
+                    messagebox.showerror("Error", payload)  # error dialog 
+        except queue.Empty:
+            pass  # nothing more for now 
+        if not finished:
+            self.after(100, self._PollQueue)  # keep polling 
+
+    def _MakeProgress(self):
+        from extractor_module import ExtractionCancelled 
+        counters = {"scan": 0, "row": 0, "table": 0, "sheet": 0, "file": 0}  # worker-side totals 
+        lastPost = [0.0]  # last queue post time 
+        def Progress(event: str, count: int):
+            if self.CancelEvent.is_set():
+                raise ExtractionCancelled()  # stop between rows/tables 
+            counters[event] += count  # accumulate 
+            now = time.monotonic()  # throttle queue traffic 
+            if event not in ("scan", "row") or now - lastPost[0] >= 0.1:  # row events are frequent 
+                lastPost[0] = now  # remember post 
+                self.Messages.put(("progress", dict(counters)))  # snapshot for the UI thread 
+        return Progress  # callback for the extractor 
+
+    def _RunWorker(self, options: Dict):
+        from extractor_module import ExtractAllTables, IterTables, JsonTablesWriter, WriteTableCsv, ExtractionCancelled 
+        from ddl_module import DdlWriter  # import here to avoid cycles 
+        progress = self._MakeProgress()  # counters + cancel check 
+        excelPath, outDir = options["excelPath"], options["outDir"]  # source + target 
+        try:
+            if options["cache"]:
+                self.Messages.put(self._RunIncremental(options, progress))  # reuse unchanged sheets 
+                return
+            extractArgs = dict(sheetsToCheck=options["sheets"], stopOnEmptyRow=options["stopOnEmptyRow"], fillMerged=options["fillMerged"], progress=progress)  # shared options 
+            if options["workers"] > 1:
+                tables = iter(ExtractAllTables(excelPath, options["pattern"], maxWorkers=options["workers"], **extractArgs))  # sheets across processes 
+            elif options["streaming"]:
+                tables = IterTables(excelPath, options["pattern"], **extractArgs)  # lazy tables 
+            else:
+                tables = IterTables(excelPath, options["pattern"], session=self.Session, **extractArgs)  # sheets parsed by an earlier run are not read again 
+            first = next(tables, None)  # peek first table 
+            if first is None:
+                self.Messages.put(("warning", "No tables found with the given header pattern."))  # warn 
+                return
+            # Exports (single pass, one table in memory when streaming) #
+            csvDir = outDir / "csv"  # csv folder 
+            sqlDir = outDir / "sql"  # sql folder 
+            jsonName = "tables.ndjson" if options["jsonLayout"] == "ndjson" else "tables.json"  # JSON file name 
+            jsonWriter = JsonTablesWriter(outDir / jsonName, options["jsonLayout"]) if options["json"] else None  # JSON writer 
+            if options["csv"]:
+                csvDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+            ddlWriter = DdlWriter(options["schemaBySheet"], sqlDir) if options["sql"] else None  # streams _ALL_TABLES.sql 
+            try:
+                for t in itertools.chain([first], tables):  # each table 
+                    if jsonWriter is not None:
+                        jsonWriter.Write(t)  # append to JSON 
+                    if options["csv"]:
+                        WriteTableCsv(t, csvDir)  # write CSV 
+                        progress("file", 1)  # file written 
+                    if ddlWriter is not None:
+                        ddlWriter.Write(t)  # write DDL + append to aggregate 
+                        progress("file", 1)  # file written 
+            except BaseException:
+                if jsonWriter is not None:
+                    jsonWriter.Abort()  # keep the previous JSON file on error/cancel 
+                raise
+            finally:
+                if jsonWriter is not None:
+                    jsonWriter.Close()  # close JSON array (no-op after Abort) 
+                if ddlWriter is not None:
+                    ddlWriter.Close()  # flush aggregate file 
+            if jsonWriter is not None:
+                progress("file", 1)  # JSON file complete 
+            if ddlWriter is not None:
+                progress("file", 1)  # aggregate file complete 
+            self.Messages.put(("done", f"Completed.\nOutput: {outDir.resolve()}"))  # success 
+        except ExtractionCancelled:
+            self.Messages.put(("cancelled", f"Run cancelled. Files already written in {outDir.resolve()} may be incomplete."))  # stopped cleanly 
+        except Exception as e:
+            self.Messages.put(("error", str(e)))  # error dialog 
+
+    def _RunInstrumented(self, options: Dict):
+        from instrumentation_module import Instrumented  # timing report / cProfile 
+        with Instrumented(options["outDir"], profile=options["profile"]):  # timings.json / profile.prof next to the outputs 
+            self._RunWorker(options)  # same run, hooks enabled 
+
+    def _RunIncremental(self, options: Dict, progress) -> Tuple[str, str]:
+        from cache_module import OutputCache  # lazy import 
+        from extractor_module import WriteTablesJson 
+        outDir = options["outDir"]  # output dir 
+        cache = OutputCache(outDir, options["pattern"], options["stopOnEmptyRow"], options["fillMerged"])  # cache in output dir 
+        session = None if options["streaming"] else self.Session  # low-memory runs keep nothing 
+        tables = cache.ExtractTables(options["excelPath"], options["sheets"], maxWorkers=options["workers"], progress=progress, session=session)  # changed sheets only 
+        if not tables:
+            cache.Save()  # keep fingerprints 
+            return "warning", "No tables found with the given header pattern."  # warn 
+        written: List[Path] = []  # rewritten files 
+        if options["json"]:
+            jsonName = "tables.ndjson" if options["jsonLayout"] == "ndjson" else "tables.json"  # JSON file name 
+            WriteTablesJson(tables, outDir / jsonName, options["jsonLayout"])  # write JSON 
+            written.append(outDir / jsonName)  # always rewritten 
+            progress("file", 1)  # file written 
+        if options["csv"]:
+            written.extend(cache.WriteCsv(tables, outDir / "csv"))  # changed CSVs only 
+        if options["sql"]:
+            written.extend(cache.WriteDdls(tables, options["schemaBySheet"], outDir / "sql"))  # changed DDLs only 
+        cache.Save()  # persist manifest 
+        progress("file", len(written) - int(options["json"]))  # CSV/DDL files rewritten 
+        reused = len(cache.UnchangedSheets)  # sheets served from cache 
+        return "done", f"Completed.\nOutput: {outDir.resolve()}\nSheets reused from cache: {reused}\nFiles written: {len(written)}"  # success 
 
 if __name__ == "__main__":
     App().mainloop()  # run app 
@@ -0,0 +1,170 @@
+# benchmark.py
+
+import argparse  # command-line parsing 
+import gc  # stable measurements 
+import json  # results 
+import platform  # environment info 
+import random  # synthetic values 
+import shutil  # temp cleanup 
+import sys  # exit code 
+import tempfile  # scratch folders 
+import time  # timers 
+import tracemalloc  # peak memory 
+from pathlib import Path  # FS paths 
+from typing import Any, Callable, Dict, List, Optional  # typing 
+
+DdlHeader = ["COLUMN NAME", "DATA TYPE", "PK", "NULL", "DEFAULT", "DESCRIPTION", "COMMENTS"]  # columns understood by ddl_module 
+DataTypes = ["NUMBER(19,0)", "VARCHAR2(50)", "DATE", "TIMESTAMP(6)", "NUMBER(10,2)", "CHAR(1)"]  # sample Oracle types 
+
+def HeaderFor(columns: int) -> List[str]:
+    if columns <= len(DdlHeader):
+        return DdlHeader[:columns]  # DDL-compatible prefix 
+    return DdlHeader + [f"EXTRA {i}" for i in range(1, columns - len(DdlHeader) + 1)]  # pad with extra columns 
+
+def GenerateWorkbook(path: Path, sheets: int = 2, rows: int = 1000, columns: int = 7, tablesPerSheet: int = 4, mergedDensity: float = 0.0, emptyGapEvery: int = 0, seed: int = 0) -> Dict[str, Any]:
+    from openpyxl import Workbook  # lazy import 
+    rng = random.Random(seed)  # reproducible content 
+    header = HeaderFor(columns)  # header pattern 
+    rowsPerTable = max(rows // max(tablesPerSheet, 1), 0)  # data rows per table 
+    workBook = Workbook(write_only=False)  # merges need a regular workbook 
+    workBook.remove(workBook.active)  # drop default sheet 
+    merged = 0  # merged ranges created 
+    for s in range(sheets):
+        sheet = workBook.create_sheet(f"SHEET_{s + 1}")  # one sheet per index 
+        r = 1  # current row 
+        for t in range(tablesPerSheet):
+            sheet.cell(r, 1, f"TABLE_{s + 1}_{t + 1}")  # title above header 
+            if columns > 1 and rng.random() < mergedDensity:
+                sheet.merge_cells(start_row=r, start_column=1, end_row=r, end_column=columns)  # merged title 
+                merged += 1  # count 
+            r += 1  # header row 
+            for k, label in enumerate(header):
+                sheet.cell(r, k + 1, label)  # header labels 
+            r += 1  # first data row 
+            for i in range(rowsPerTable):
+                if emptyGapEvery and i and i % emptyGapEvery == 0:
+                    r += 1  # empty spacer row inside the table 
+                values = [f"COL_{i + 1}", rng.choice(DataTypes), rng.choice(["YES", "NO", "NO", "NO"]), rng.choice(["YES", "NO"]), rng.choice(["-", "0", "SYSDATE", None]), f"Description of column {i + 1}", "Synthetic table"]  # DDL-shaped row 
+                values += [rng.randint(0, 10 ** 6) for _ in range(columns - len(values))]  # extra numeric columns 
+                for k in range(columns):
+                    sheet.cell(r, k + 1, values[k])  # write cell 
+                if mergedDensity and columns > 6 and rng.random() < mergedDensity:
+                    sheet.merge_cells(start_row=r, start_column=6, end_row=r, end_column=7)  # description spills into comments 
+                    merged += 1  # count 
+                r += 1  # next row 
+            r += 1  # empty row ends the table 
+    workBook.save(path)  # write file 
+    return {"sheets": sheets, "rows": rows, "columns": columns, "tables_per_sheet": tablesPerSheet, "merged_density": mergedDensity, "empty_gap_every": emptyGapEvery, "merged_ranges": merged, "cells": sheets * (rows + 2 * tablesPerSheet) * columns, "file_bytes": path.stat().st_size}  # shape 
+
+def Measure(fn: Callable[[], Any], repeat: int = 1, memory: bool = True) -> Dict[str, Any]:
+    seconds: List[float] = []  # timings 
+    result = None  # last result 
+    for _ in range(max(repeat, 1)):
+        gc.collect()  # start clean 
+        t0 = time.perf_counter()  # timer 
+        result = fn()  # run stage 
+        seconds.append(time.perf_counter() - t0)  # elapsed 
+    stats: Dict[str, Any] = {"seconds": round(min(seconds), 6), "runs": [round(x, 6) for x in seconds]}  # best of N 
+    if memory:
+        gc.collect()  # start clean 
+        tracemalloc.start()  # separate pass: tracing slows the code down 
+        fn()  # run stage again 
+        stats["peak_bytes"] = tracemalloc.get_traced_memory()[1]  # peak allocation 
+        tracemalloc.stop()  # stop tracing 
+    return {"stats": stats, "result": result}  # measurement + stage output 
+
+def RunShape(workDir: Path, shape: Dict[str, Any], repeat: int = 1, memory: bool = True) -> Dict[str, Any]:
+    from openpyxl import load_workbook  # Excel reader 
+    from extractor_module import FindHeaderPositions, ReadTable, IterTables, WriteTablesJson, WriteTablesCsv  # pipeline 
+    from ddl_module import WriteAllDdls  # DDL stage 
+    excelPath = workDir / "bench.xlsx"  # synthetic workbook 
+    info = GenerateWorkbook(excelPath, **shape)  # build input 
+    pattern = HeaderFor(shape.get("columns", 7))  # header pattern 
+    stopOnEmptyRow = not shape.get("emptyGapEvery")  # gaps need the non-stopping policy 
+    stages: Dict[str, Any] = {}  # per-stage stats 
+    loaded = Measure(lambda: load_workbook(excelPath, data_only=True), repeat, memory)  # parse workbook 
+    stages["load_workbook"] = loaded["stats"]  # stats 
+    workBook = loaded["result"]  # parsed workbook 
+    found = Measure(lambda: {ws.title: FindHeaderPositions(ws, pattern) for ws in workBook.worksheets}, repeat, memory)  # header scan 
+    stages["find_headers"] = found["stats"]  # stats 
+    read = Measure(lambda: [ReadTable(workBook[name], start, pattern, stopOnEmptyRow) for name, starts in found["result"].items() for start in starts], repeat, memory)  # table read 
+    stages["read_tables"] = read["stats"]  # stats 
+    tables = read["result"]  # extracted tables 
+    stages["streaming_extract"] = Measure(lambda: sum(1 for _ in IterTables(excelPath, pattern, stopOnEmptyRow=stopOnEmptyRow)), repeat, memory)["stats"]  # read-only pipeline 
+    stages["write_json"] = Measure(lambda: WriteTablesJson(tables, workDir / "tables.json"), repeat, memory)["stats"]  # JSON stage 
+    stages["write_csv"] = Measure(lambda: WriteTablesCsv(tables, workDir / "csv"), repeat, memory)["stats"]  # CSV stage 
+    schemaBySheet = {ws.title: "BENCH" for ws in workBook.worksheets}  # schema map 
+    stages["write_ddls"] = Measure(lambda: WriteAllDdls(tables, schemaBySheet, workDir / "sql"), repeat, memory)["stats"]  # DDL stage 
+    for stats in stages.values():
+        stats["us_per_cell"] = round(stats["seconds"] * 1e6 / max(info["cells"], 1), 4)  # normalized cost for scaling checks 
+    return {"shape": info, "tables": len(tables), "rows_read": sum(t.RowCount() for t in tables), "stages": stages}  # shape result 
+
+def ShapeKey(shape: Dict[str, Any]) -> str:
+    return "s{sheets}-r{rows}-c{columns}-t{tables_per_sheet}-m{merged_density}-g{empty_gap_every}".format(**shape)  # stable id 
+
+def CheckScaling(results: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    problems: List[str] = []  # superlinear stages 
+    ordered = sorted(results, key=lambda r: r["shape"]["cells"])  # small → large 
+    if len(ordered) < 2:
+        return problems  # nothing to compare 
+    small, large = ordered[0], ordered[-1]  # extremes 
+    for stage, stats in large["stages"].items():
+        base = small["stages"][stage]["us_per_cell"]  # cost per cell on the small shape 
+        if base > 0 and stats["us_per_cell"] > base * (1 + tolerance):
+            problems.append(f"{stage}: {base} → {stats['us_per_cell']} us/cell ({small['shape']['cells']} → {large['shape']['cells']} cells)")  # grows faster than linear 
+    return problems  # findings 
+
+def CompareRuns(current: Dict[str, Any], previous: Dict[str, Any], tolerance: float) -> List[str]:
+    problems: List[str] = []  # regressions 
+    before = {ShapeKey(r["shape"]): r for r in previous.get("results", [])}  # previous by shape 
+    for r in current["results"]:
+        old = before.get(ShapeKey(r["shape"]))  # same shape in previous run 
+        if old is None:
+            continue  # new shape 
+        for stage, stats in r["stages"].items():
+            prev = old["stages"].get(stage)  # previous stage stats 
+            if prev and prev["seconds"] > 0 and stats["seconds"] > prev["seconds"] * (1 + tolerance):
+                problems.append(f"{ShapeKey(r['shape'])} {stage}: {prev['seconds']}s → {stats['seconds']}s")  # slower 
+            if prev and prev.get("peak_bytes") and stats.get("peak_bytes", 0) > prev["peak_bytes"] * (1 + tolerance):
+                problems.append(f"{ShapeKey(r['shape'])} {stage}: peak {prev['peak_bytes']} → {stats['peak_bytes']} bytes")  # bigger 
+    return problems  # findings 
+
+def Main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the extractor and DDL pipeline on synthetic workbooks.")  # parser 
+    parser.add_argument("--sheets", type=int, default=2, help="sheets per workbook (default: 2)")  # shape 
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 4000], help="data rows per sheet, one run per value (default: 1000 4000)")  # shape 
+    parser.add_argument("--columns", type=int, default=7, help="columns per table (default: 7)")  # shape 
+    parser.add_argument("--tables", type=int, default=4, help="tables per sheet (default: 4)")  # shape 
+    parser.add_argument("--merged-density", type=float, default=0.0, help="share of data rows with a merged range (default: 0)")  # shape 
+    parser.add_argument("--empty-gap-every", type=int, default=0, help="insert an empty row every N data rows (default: none)")  # shape 
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")  # reproducibility 
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per stage, best is kept (default: 3)")  # stability 
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")  # faster runs 
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative growth for scaling/compare checks (default: 0.5)")  # thresholds 
+    parser.add_argument("--compare", help="previous results JSON to compare against")  # regression check 
+    parser.add_argument("-o", "--output", default="bench_results.json", help="results file (default: bench_results.json)")  # output 
+    args = parser.parse_args(argv)  # parse CLI 
+    workRoot = Path(tempfile.mkdtemp(prefix="excel_bench_"))  # scratch space 
+    results: List[Dict[str, Any]] = []  # per-shape results 
+    try:
+        for rows in args.rows:
+            shape = {"sheets": args.sheets, "rows": rows, "columns": args.columns, "tablesPerSheet": args.tables, "mergedDensity": args.merged_density, "emptyGapEvery": args.empty_gap_every, "seed": args.seed}  # generator args 
+            workDir = workRoot / f"rows_{rows}"  # per-shape folder 
+            workDir.mkdir()  # create 
+            result = RunShape(workDir, shape, args.repeat, not args.no_memory)  # run pipeline 
+            results.append(result)  # keep 
+            print(f"{ShapeKey(result['shape'])}: " + ", ".join(f"{k}={v['seconds']:.3f}s" for k, v in result["stages"].items()))  # summary line 
+    finally:
+        shutil.rmtree(workRoot, ignore_errors=True)  # cleanup 
+    import openpyxl  # version info 
+    report = {"environment": {"python": platform.python_version(), "openpyxl": openpyxl.__version__, "platform": platform.platform()}, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}  # results document 
+    report["scaling_problems"] = CheckScaling(results, args.tolerance)  # linearity check 
+    if args.compare:
+        report["regressions"] = CompareRuns(report, json.loads(Path(args.compare).read_text(encoding="utf-8")), args.tolerance)  # against a previous run 
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")  # machine-readable output 
+    for problem in report["scaling_problems"] + report.get("regressions", []):
+        print(f"WARNING {problem}", file=sys.stderr)  # surface findings 
+    return 1 if report["scaling_problems"] or report.get("regressions") else 0  # CI-friendly exit code 
+
+if __name__ == "__main__":
+    sys.exit(Main())  # run benchmarks 
@@ -0,0 +1,192 @@
+# cache_module.py
+
+import hashlib  # content fingerprints 
+import io  # in-memory CSV text 
+import json  # manifest read/write 
+import re  # shared-string references 
+from pathlib import Path  # FS paths 
+from typing import Any, Dict, List, Optional, Set  # typing 
+from openpyxl import load_workbook  # Excel reader 
+from extractor_module import ExtractAllTables, IterTables, CompileHeaderPatterns, PatternSpec, CsvFileName, WriteCsvRows, ProgressCallback, JsonTablesWriter  # extraction + CSV 
+from ddl_module import GenerateTableDdl, SchemaForTable, DdlFileName, IterTablesFromJson  # DDL + NDJSON reader 
+from table_module import ColumnarTable  # compact table object 
+from instrumentation_module import CountFile  # timing hooks, no-op when disabled 
+
+CacheDirName = ".excel_cache"  # cache folder inside the output directory 
+CacheVersion = 4  # bump to invalidate caches written by older code 
+SharedStringRef = re.compile(rb'<(?:\w+:)?c\b[^>]*\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)<')  # <c t="s"><v>idx</v> cells 
+StyleRef = re.compile(rb'<(?:\w+:)?c\b[^>]*\bs="(\d+)"')  # <c s="idx"> cell style references 
+
+def _Digest(*parts: bytes) -> str:
+    h = hashlib.sha256()  # content hash 
+    for part in parts:
+        h.update(part)  # feed part 
+        h.update(b"\0")  # separator 
+    return h.hexdigest()  # hex digest 
+
+def _XmlElement(data: bytes, name: str) -> bytes:
+    start = re.search(rb"<(?:\w+:)?" + name.encode() + rb"\b[^>]*?(/?)>", data)  # opening tag 
+    if start is None:
+        return b""  # element missing 
+    if start.group(1):
+        return start.group(0)  # self-closing, e.g. <sheetData/> 
+    end = re.compile(rb"</(?:\w+:)?" + name.encode() + rb">").search(data, start.end())  # closing tag 
+    return data[start.start():end.end() if end else len(data)]  # element text 
+
+def SheetFingerprints(excelPath: Path, sheetNames: Optional[List[str]] = None) -> Dict[str, str]:
+    workBook = load_workbook(excelPath, read_only=True)  # parses the shared string table and styles only 
+    try:
+        archive = workBook._archive  # underlying xlsx zip 
+        epoch = workBook.epoch.isoformat().encode()  # 1900/1904 date system 
+        dateStyles, timedeltaStyles = workBook._date_formats, workBook._timedelta_formats  # cell styles openpyxl turns into dates/durations 
+        fingerprints: Dict[str, str] = {}  # sheet → fingerprint 
+        for name in (sheetNames if sheetNames is not None else workBook.sheetnames):  # each sheet 
+            sheet = workBook[name]  # read-only worksheet 
+            data = archive.read(sheet._worksheet_path)  # raw sheet xml 
+            cells = _XmlElement(data, "sheetData")  # values only, not selection/tabSelected/view state 
+            merges = _XmlElement(data, "mergeCells")  # merged ranges (titles, fill mode) 
+            strings = sheet._shared_strings  # shared string table 
+            referenced = b"\x1f".join(str(strings[int(m.group(1))]).encode("utf-8") for m in SharedStringRef.finditer(cells))  # referenced text, in cell order 
+            styles = sorted({int(m.group(1)) for m in StyleRef.finditer(cells)})  # styles used on this sheet 
+            kinds = ",".join(f"{i}:{int(i in dateStyles)}{int(i in timedeltaStyles)}" for i in styles).encode()  # how each style converts numbers 
+            fingerprints[name] = _Digest(epoch, kinds, cells, merges, referenced)  # inputs of this sheet's extracted values only 
+        return fingerprints  # per-sheet fingerprints 
+    finally:
+        workBook.close()  # release archive handle 
+
+def ConfigFingerprint(pattern: PatternSpec, stopOnEmptyRow: bool, fillMerged: bool) -> str:
+    key = json.dumps([CacheVersion, CompileHeaderPatterns(pattern).Normalized, stopOnEmptyRow, fillMerged])  # extraction settings 
+    return _Digest(key.encode("utf-8"))  # settings hash 
+
+class OutputCache:
+    def __init__(self, outDir: Path, pattern: PatternSpec, stopOnEmptyRow: bool = True, fillMerged: bool = False):
+        self.OutDir = outDir  # output directory 
+        self.CacheDir = outDir / CacheDirName  # cache folder 
+        self.Pattern = pattern  # header pattern 
+        self.StopOnEmptyRow = stopOnEmptyRow  # stop policy 
+        self.FillMerged = fillMerged  # merged fill policy 
+        self.Config = ConfigFingerprint(pattern, stopOnEmptyRow, fillMerged)  # invalidation key for extracted tables 
+        self.Manifest: Dict[str, Any] = {"version": CacheVersion, "config": self.Config, "sheets": {}, "files": {}}  # fresh manifest 
+        self.UnchangedSheets: Set[str] = set()  # sheets reused this run 
+        manifestPath = self.CacheDir / "manifest.json"  # manifest path 
+        if manifestPath.exists():
+            try:
+                stored = json.loads(manifestPath.read_text(encoding="utf-8"))  # previous run 
+            except ValueError:
+                stored = None  # corrupt manifest, start over 
+            if stored and stored.get("version") == CacheVersion:
+                self.Manifest["files"] = stored.get("files", {})  # written file hashes stay valid 
+                if stored.get("config") == self.Config:  # pattern/options unchanged 
+                    self.Manifest["sheets"] = stored.get("sheets", {})  # per-sheet entries reusable 
+
+    def _TablesPath(self, sheetName: str) -> Path:
+        return self.CacheDir / (hashlib.sha1(sheetName.encode("utf-8")).hexdigest() + ".ndjson")  # per-sheet tables, data only (never unpickled) 
+
+    def _ReadTables(self, sheetName: str) -> List[ColumnarTable]:
+        tables = list(IterTablesFromJson(self._TablesPath(sheetName)))  # same reader as tables.ndjson 
+        for t in tables:
+            t.StartCell = tuple(t.StartCell)  # JSON array → (row, col) 
+        return tables  # cached tables 
+
+    def _WriteTables(self, sheetName: str, tables: List[ColumnarTable]):
+        writer = JsonTablesWriter(self._TablesPath(sheetName), "ndjson", default=str)  # dates/times kept as their text, as in CSV/DDL 
+        try:
+            for t in tables:
+                writer.Write(t)  # one table record + row records 
+        except BaseException:
+            writer.Abort()  # no partial cache file 
+            raise
+        writer.Close()  # flush, publish file 
+
+    def ExtractTables(self, excelPath: Path, sheetsToCheck: Optional[set] = None, maxWorkers: int = 1, progress: Optional[ProgressCallback] = None, session=None) -> List[ColumnarTable]:
+        fingerprints = session.Fingerprints(excelPath) if session is not None else SheetFingerprints(excelPath)  # current sheet fingerprints, workbook order; a session reopens the file only after it changes 
+        targetSheets = [n for n in fingerprints if sheetsToCheck is None or n in sheetsToCheck]  # filter sheets 
+        sheets = self.Manifest["sheets"]  # cached entries 
+        tablesBySheet: Dict[str, List[ColumnarTable]] = {}  # tables per sheet 
+        self.UnchangedSheets = set()  # reset 
+        for name in targetSheets:  # reuse unchanged sheets 
+            entry = sheets.get(name)  # cached entry 
+            if entry and entry.get("fingerprint") == fingerprints[name] and self._TablesPath(name).exists():
+                tablesBySheet[name] = self._ReadTables(name)  # cached tables 
+                self.UnchangedSheets.add(name)  # outputs reusable 
+                if progress is not None:
+                    progress("table", len(tablesBySheet[name]))  # tables from cache 
+                    progress("sheet", 1)  # sheet done 
+        changed = [n for n in targetSheets if n not in self.UnchangedSheets]  # sheets to extract 
+        if changed:
+            if maxWorkers > 1:
+                extracted = ExtractAllTables(excelPath, self.Pattern, set(changed), self.StopOnEmptyRow, fillMerged=self.FillMerged, maxWorkers=maxWorkers, progress=progress)  # sheets across processes 
+            else:
+                extracted = IterTables(excelPath, self.Pattern, set(changed), self.StopOnEmptyRow, self.FillMerged, progress, session)  # read-only row pass, or rows kept by a GUI session 
+            for name in changed:
+                tablesBySheet[name] = []  # sheets without tables stay cached too 
+            for t in extracted:
+                tablesBySheet[t.Sheet].append(t)  # group by sheet 
+            self.CacheDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+            for name in changed:
+                self._WriteTables(name, tablesBySheet[name])  # store tables 
+                sheets[name] = {"fingerprint": fingerprints[name]}  # new entry, outputs recomputed 
+        return [t for name in targetSheets for t in tablesBySheet[name]]  # workbook/sheet/position order 
+
+    def _WriteIfChanged(self, path: Path, desired: Dict[str, Any]) -> bool:
+        key = Path(path).relative_to(self.OutDir).as_posix() if Path(path).is_relative_to(self.OutDir) else str(path)  # manifest key 
+        files = self.Manifest["files"]  # recorded hashes 
+        if files.get(key) == desired["hash"] and path.exists():
+            return False  # same content already on disk 
+        text = desired["text"]() if callable(desired["text"]) else desired["text"]  # build content lazily 
+        path.write_text(text, encoding="utf-8", newline=desired.get("newline"))  # write content 
+        CountFile(path)  # bytes + files counters 
+        files[key] = desired["hash"]  # record hash 
+        return True  # file rewritten 
+
+    def WriteCsv(self, tables: List[ColumnarTable], outDir: Path) -> List[Path]:
+        outDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+        desiredByName: Dict[str, Dict[str, Any]] = {}  # file → content (last table wins, like a plain rewrite) 
+        pieces: Dict[str, List[List[str]]] = {}  # sheet → [[file, hash], ...] 
+        cachedPieces = {n: iter(self.Manifest["sheets"][n].get("csv", [])) for n in self.UnchangedSheets}  # reusable hashes 
+        for t in tables:
+            cached = next(cachedPieces[t.Sheet], None) if t.Sheet in cachedPieces else None  # piece from last run 
+            if cached is not None:
+                name, digest = cached  # reuse name + hash 
+                text = lambda t=t: _CsvText(t)  # generated only if the file must be written 
+            else:
+                name = CsvFileName(t)  # file name 
+                text = _CsvText(t)  # CSV content 
+                digest = _Digest(text.encode("utf-8"))  # content hash 
+            desiredByName[name] = {"hash": digest, "text": text, "newline": ""}  # desired state, csv module writes its own line ends 
+            pieces.setdefault(t.Sheet, []).append([name, digest])  # remember for next run 
+        for name, entry in pieces.items():
+            self.Manifest["sheets"].setdefault(name, {})["csv"] = entry  # store pieces 
+        return [outDir / name for name, desired in desiredByName.items() if self._WriteIfChanged(outDir / name, desired)]  # rewritten files 
+
+    def WriteDdls(self, tables: List[ColumnarTable], schemaBySheet: Dict[str, str], outDir: Path) -> List[Path]:
+        outDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+        desiredByName: Dict[str, Dict[str, Any]] = {}  # file → content (last table wins) 
+        allDdls: List[str] = []  # aggregate ddl 
+        pieces: Dict[str, List[List[str]]] = {}  # sheet → [[file, ddl], ...] 
+        sheets = self.Manifest["sheets"]  # cached entries 
+        cachedPieces: Dict[str, Any] = {}  # reusable pieces 
+        for name in self.UnchangedSheets:
+            ddlEntry = sheets[name].get("ddl")  # cached DDL entry 
+            if ddlEntry and ddlEntry.get("schema") == schemaBySheet.get(name, next(iter(schemaBySheet.values()))):  # schema mapping unchanged 
+                cachedPieces[name] = iter(ddlEntry["pieces"])  # reuse pieces 
+        for t in tables:
+            cached = next(cachedPieces[t.Sheet], None) if t.Sheet in cachedPieces else None  # piece from last run 
+            name, ddl = cached if cached is not None else (DdlFileName(t), GenerateTableDdl(t, SchemaForTable(t, schemaBySheet)))  # file + DDL text 
+            desiredByName[name] = {"hash": _Digest(ddl.encode("utf-8")), "text": ddl}  # desired state 
+            allDdls.append(ddl)  # aggregate from pieces 
+            pieces.setdefault(t.Sheet, []).append([name, ddl])  # remember for next run 
+        for name, entry in pieces.items():
+            sheets.setdefault(name, {})["ddl"] = {"schema": SchemaForTable({"sheet": name}, schemaBySheet), "pieces": entry}  # store pieces 
+        allText = "\n".join(allDdls)  # aggregate file content 
+        desiredByName["_ALL_TABLES.sql"] = {"hash": _Digest(allText.encode("utf-8")), "text": allText}  # rebuilt from pieces 
+        return [outDir / name for name, desired in desiredByName.items() if self._WriteIfChanged(outDir / name, desired)]  # rewritten files 
+
+    def Save(self):
+        self.CacheDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+        (self.CacheDir / "manifest.json").write_text(json.dumps(self.Manifest, ensure_ascii=False), encoding="utf-8")  # persist manifest 
+
+def _CsvText(t: ColumnarTable) -> str:
+    buffer = io.StringIO(newline="")  # in-memory file 
+    WriteCsvRows(buffer, t)  # same bytes as WriteTableCsv 
+    return buffer.getvalue()  # CSV content 
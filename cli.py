@@ -0,0 +1,263 @@
+# cli.py
+
+import argparse  # command-line parsing 
+import glob  # input globs 
+import json  # manifest 
+import sys  # exit code 
+import time  # timings 
+from concurrent.futures import ProcessPoolExecutor  # workbook-level concurrency 
+from contextlib import nullcontext  # instrumentation off 
+from datetime import datetime, timezone  # manifest timestamps 
+from pathlib import Path  # FS paths 
+from typing import Any, Dict, List, Optional  # typing 
+
+ExcelSuffixes = (".xlsx", ".xlsm", ".xltx", ".xltm")  # same types as the GUI file dialog 
+Formats = ("json", "csv", "sql")  # available exports 
+
+def ExpandInputs(inputs: List[str], recursive: bool = False) -> List[Path]:
+    found: List[Path] = []  # workbooks in argument order 
+    for arg in inputs:
+        p = Path(arg)  # candidate path 
+        if p.is_dir():
+            pattern = "**/*" if recursive else "*"  # directory scan depth 
+            candidates = sorted(p.glob(pattern))  # directory content 
+        elif any(ch in arg for ch in "*?["):
+            candidates = sorted(Path(x) for x in glob.glob(arg, recursive=True))  # glob expansion 
+        else:
+            candidates = [p]  # plain file 
+        for c in candidates:
+            if c.is_file() and c.suffix.lower() in ExcelSuffixes and not c.name.startswith("~$"):  # skip Excel lock files 
+                if c.resolve() not in {f.resolve() for f in found}:
+                    found.append(c)  # keep first occurrence 
+    return found  # workbook list 
+
+def ParseSchemas(values: List[str]) -> Dict[str, str]:
+    mapping: Dict[str, str] = {}  # sheet → schema 
+    for v in values:
+        if "=" not in v:
+            raise ValueError(f"Invalid --schema value (expected SHEET=SCHEMA): {v}")  # bad format 
+        sheet, schema = v.split("=", 1)  # split once 
+        mapping[sheet.strip()] = schema.strip()  # store 
+    return mapping  # map 
+
+def OutputDirs(workbooks: List[Path], outRoot: Path) -> List[Path]:
+    dirs: List[Path] = []  # one folder per workbook 
+    used: Dict[str, int] = {}  # stem → count 
+    for wbPath in workbooks:
+        stem = wbPath.stem  # folder name 
+        used[stem] = used.get(stem, 0) + 1  # same stem in several folders 
+        dirs.append(outRoot / (stem if used[stem] == 1 else f"{stem}_{used[stem]}"))  # unique folder 
+    return dirs  # folders 
+
+def ProcessWorkbook(job: Dict[str, Any]) -> Dict[str, Any]:
+    from instrumentation_module import Instrumented  # timing report / cProfile 
+    excelPath = Path(job["workbook"])  # source workbook 
+    outDir = Path(job["output_dir"])  # workbook output folder 
+    entry: Dict[str, Any] = {"workbook": str(excelPath), "output_dir": str(outDir), "tables": [], "files": [], "timings": {}, "error": None}  # manifest entry 
+    started = time.perf_counter()  # total timer 
+    instrumented = job["timing_report"] or job["profile"]  # opt-in, zero hooks otherwise 
+    try:
+        outDir.mkdir(parents=True, exist_ok=True)  # ensure dir 
+        with Instrumented(outDir, profile=job["profile"]) if instrumented else nullcontext():  # timings.json / profile.prof next to outputs 
+            _ProcessWorkbook(job, excelPath, outDir, entry)  # extract + export 
+        if instrumented:
+            entry["files"].append(str(outDir / "timings.json"))  # timing report 
+        if job["profile"]:
+            entry["files"].append(str(outDir / "profile.prof"))  # cProfile stats 
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"  # keep going with other workbooks 
+    entry["timings"]["total"] = round(time.perf_counter() - started, 6)  # seconds 
+    return entry  # manifest entry 
+
+def _TableEntry(t, job: Dict[str, Any], outDir: Path) -> Dict[str, Any]:
+    from extractor_module import CsvFileName  # CSV file names 
+    from ddl_module import DdlFileName  # DDL file names 
+    tableEntry = {"table_name": t["table_name"], "sheet": t["sheet"], "start_cell": list(t["start_cell"]), "pattern": t.Pattern if t.Pattern is not None else job["pattern"], "rows": len(t["rows"]), "files": []}  # table summary 
+    if "csv" in job["formats"]:
+        tableEntry["files"].append(str(outDir / "csv" / CsvFileName(t)))  # CSV output 
+    if "sql" in job["formats"]:
+        tableEntry["files"].append(str(outDir / "sql" / DdlFileName(t)))  # DDL output 
+    return tableEntry  # manifest entry for one table 
+
+def _AddOutputFiles(entry: Dict[str, Any], outDir: Path, suffix: str):
+    entry["files"].extend(sorted({f for te in entry["tables"] for f in te["files"] if f.endswith(suffix)}))  # record files 
+    if suffix == ".sql":
+        entry["files"].append(str(outDir / "sql" / "_ALL_TABLES.sql"))  # aggregate file 
+
+def _StreamWorkbook(job: Dict[str, Any], excelPath: Path, outDir: Path, entry: Dict[str, Any]):
+    from extractor_module import IterTables, JsonTablesWriter, WriteTableCsv  # lazy tables + per-table writers 
+    from ddl_module import DdlWriter  # streams _ALL_TABLES.sql 
+    started = time.perf_counter()  # total timer 
+    writerSeconds = {f: 0.0 for f in job["formats"]}  # time spent in each writer, the rest is extraction 
+    schemaBySheet = {"": job["default_schema"], **job["schemas"]}  # unknown sheets fall back to the first value, as with the map built from the tables 
+    jsonPath = outDir / ("tables.ndjson" if job["json_layout"] == "ndjson" else "tables.json")  # JSON file 
+    jsonWriter = ddlWriter = None  # opened with the first table, nothing is written for a workbook without tables 
+    try:
+        for t in IterTables(excelPath, job["pattern"], job["sheets"], job["stop_on_empty_row"], job["fill_merged"]):  # one table in memory at a time 
+            entry["tables"].append(_TableEntry(t, job, outDir))  # add summary 
+            if "json" in job["formats"]:
+                t0 = time.perf_counter()  # stage timer 
+                if jsonWriter is None:
+                    jsonWriter = JsonTablesWriter(jsonPath, job["json_layout"])  # incremental JSON 
+                jsonWriter.Write(t)  # append table 
+                writerSeconds["json"] += time.perf_counter() - t0  # seconds 
+            if "csv" in job["formats"]:
+                t0 = time.perf_counter()  # stage timer 
+                if len(entry["tables"]) == 1:
+                    (outDir / "csv").mkdir(parents=True, exist_ok=True)  # ensure folder 
+                WriteTableCsv(t, outDir / "csv")  # write CSV 
+                writerSeconds["csv"] += time.perf_counter() - t0  # seconds 
+            if "sql" in job["formats"]:
+                t0 = time.perf_counter()  # stage timer 
+                if ddlWriter is None:
+                    ddlWriter = DdlWriter(schemaBySheet, outDir / "sql", job["sql_workers"])  # per-table files + aggregate 
+                ddlWriter.Write(t)  # write DDL 
+                writerSeconds["sql"] += time.perf_counter() - t0  # seconds 
+    except BaseException:
+        if jsonWriter is not None:
+            jsonWriter.Abort()  # keep the previous JSON file 
+        raise
+    finally:
+        if jsonWriter is not None:
+            t0 = time.perf_counter()  # stage timer 
+            jsonWriter.Close()  # close JSON array (no-op after Abort) 
+            writerSeconds["json"] += time.perf_counter() - t0  # seconds 
+        if ddlWriter is not None:
+            t0 = time.perf_counter()  # stage timer 
+            ddlWriter.Close()  # wait for file writes, flush aggregate 
+            writerSeconds["sql"] += time.perf_counter() - t0  # seconds 
+    entry["timings"]["extract"] = round(time.perf_counter() - started - sum(writerSeconds.values()), 6)  # seconds 
+    if not entry["tables"]:
+        return  # no outputs 
+    if jsonWriter is not None:
+        entry["files"].append(str(jsonPath))  # record file 
+    for f in ("csv", "sql"):
+        if f in job["formats"]:
+            _AddOutputFiles(entry, outDir, "." + f)  # record files 
+    for f in Formats:
+        if f in writerSeconds:
+            entry["timings"][f] = round(writerSeconds[f], 6)  # seconds 
+
+def _ProcessWorkbook(job: Dict[str, Any], excelPath: Path, outDir: Path, entry: Dict[str, Any]):
+    from extractor_module import ExtractAllTables, WriteTablesJson, WriteTablesCsv  # extraction + writers 
+    from ddl_module import WriteAllDdls  # DDL writers 
+    if job["streaming"] and not job["incremental"]:
+        return _StreamWorkbook(job, excelPath, outDir, entry)  # single pass, tables are not kept 
+    t0 = time.perf_counter()  # stage timer 
+    cache = None  # incremental cache 
+    if job["incremental"]:
+        from cache_module import OutputCache  # lazy import 
+        cache = OutputCache(outDir, job["pattern"], job["stop_on_empty_row"], job["fill_merged"])  # cache in output dir 
+        tables = cache.ExtractTables(excelPath, job["sheets"])  # changed sheets only 
+    else:
+        tables = ExtractAllTables(excelPath, job["pattern"], sheetsToCheck=job["sheets"], stopOnEmptyRow=job["stop_on_empty_row"], fillMerged=job["fill_merged"])  # parse tables 
+    entry["timings"]["extract"] = round(time.perf_counter() - t0, 6)  # seconds 
+    sheetNames = sorted({t["sheet"] for t in tables})  # sheets with tables 
+    schemaBySheet = {s: job["schemas"].get(s, job["default_schema"]) for s in sheetNames} or {"": job["default_schema"]}  # schema map 
+    for t in tables:
+        entry["tables"].append(_TableEntry(t, job, outDir))  # add summary 
+    if tables and "json" in job["formats"]:
+        t0 = time.perf_counter()  # stage timer 
+        jsonPath = outDir / ("tables.ndjson" if job["json_layout"] == "ndjson" else "tables.json")  # JSON file 
+        WriteTablesJson(tables, jsonPath, job["json_layout"])  # write JSON 
+        entry["files"].append(str(jsonPath))  # record file 
+        entry["timings"]["json"] = round(time.perf_counter() - t0, 6)  # seconds 
+    if tables and "csv" in job["formats"]:
+        t0 = time.perf_counter()  # stage timer 
+        if cache is not None:
+            cache.WriteCsv(tables, outDir / "csv")  # changed CSVs only 
+        else:
+            WriteTablesCsv(tables, outDir / "csv")  # write CSVs 
+        _AddOutputFiles(entry, outDir, ".csv")  # record files 
+        entry["timings"]["csv"] = round(time.perf_counter() - t0, 6)  # seconds 
+    if tables and "sql" in job["formats"]:
+        t0 = time.perf_counter()  # stage timer 
+        if cache is not None:
+            cache.WriteDdls(tables, schemaBySheet, outDir / "sql")  # changed DDLs only 
+        else:
+            WriteAllDdls(tables, schemaBySheet, outDir / "sql", job["sql_workers"])  # write DDLs 
+        _AddOutputFiles(entry, outDir, ".sql")  # record files 
+        entry["timings"]["sql"] = round(time.perf_counter() - t0, 6)  # seconds 
+    if cache is not None:
+        cache.Save()  # persist manifest 
+
+def BuildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Extract tables from Excel workbooks to JSON / CSV / Oracle DDL without the GUI.")  # parser 
+    parser.add_argument("inputs", nargs="+", help="workbook files, directories or glob patterns (e.g. 'specs/**/*.xlsx')")  # sources 
+    parser.add_argument("-p", "--pattern", required=True, action="append", help="header pattern, comma separated (e.g. 'COLUMN NAME, DATA TYPE, PK'); repeat to match several patterns in one pass")  # header pattern(s) 
+    parser.add_argument("-o", "--out", default="out", help="output root; each workbook gets its own folder (default: out)")  # output root 
+    parser.add_argument("-f", "--formats", default="json,csv,sql", help="comma separated exports: json, csv, sql (default: all)")  # exports 
+    parser.add_argument("-s", "--schema", action="append", default=[], metavar="SHEET=SCHEMA", help="schema for a sheet, repeatable")  # schema map 
+    parser.add_argument("--default-schema", default="MYSCHEMA", help="schema for sheets without --schema (default: MYSCHEMA)")  # fallback schema 
+    parser.add_argument("--sheets", help="comma separated sheet names to parse (default: all)")  # sheet filter 
+    parser.add_argument("--json-layout", choices=("indented", "compact", "ndjson"), default="indented", help="JSON layout (default: indented)")  # JSON layout 
+    parser.add_argument("--no-stop-on-empty-row", action="store_true", help="do not end a table at the first empty row")  # stop policy 
+    parser.add_argument("--fill-merged", action="store_true", help="fill merged data cells with the anchor value")  # merged fill 
+    parser.add_argument("--streaming", action="store_true", help="read workbooks in low-memory streaming mode: one pass, each table is written as soon as it ends (ignored with --incremental)")  # read-only mode 
+    parser.add_argument("--incremental", action="store_true", help="reuse the per-output-folder cache of unchanged sheets")  # cache 
+    parser.add_argument("-j", "--workers", type=int, default=1, help="workbooks processed concurrently (default: 1)")  # concurrency 
+    parser.add_argument("--sql-workers", type=int, default=1, help="threads writing the per-table .sql files (default: 1)")  # DDL file writers 
+    parser.add_argument("-r", "--recursive", action="store_true", help="scan directories recursively")  # directory depth 
+    parser.add_argument("-m", "--manifest", help="manifest path (default: <out>/manifest.json)")  # manifest path 
+    parser.add_argument("--timing-report", action="store_true", help="write per-stage timings and counters to timings.json in each output folder")  # instrumentation 
+    parser.add_argument("--profile", action="store_true", help="also capture a cProfile profile.prof per workbook (implies --timing-report)")  # cProfile 
+    return parser  # parser 
+
+def Main(argv: Optional[List[str]] = None) -> int:
+    args = BuildParser().parse_args(argv)  # parse CLI 
+    patterns = [[s.strip() for s in p.split(",") if s.strip()] for p in args.pattern]  # parse patterns 
+    pattern = patterns[0] if len(patterns) == 1 else patterns  # single pattern stays a flat list 
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]  # parse formats 
+    unknown = [f for f in formats if f not in Formats]  # invalid formats 
+    if not all(patterns) or unknown:
+        print(f"Error: invalid pattern or formats {unknown}", file=sys.stderr)  # usage error 
+        return 2
+    try:
+        schemas = ParseSchemas(args.schema)  # sheet → schema 
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)  # usage error 
+        return 2
+    workbooks = ExpandInputs(args.inputs, args.recursive)  # resolve inputs 
+    if not workbooks:
+        print("Error: no Excel workbooks found.", file=sys.stderr)  # nothing to do 
+        return 2
+    outRoot = Path(args.out)  # output root 
+    sheets = {s.strip() for s in args.sheets.split(",") if s.strip()} if args.sheets else None  # sheet filter 
+    jobs = [{  # one job per workbook 
+        "workbook": str(wbPath), "output_dir": str(outDir), "pattern": pattern, "formats": formats, "sheets": sheets,
+        "schemas": schemas, "default_schema": args.default_schema, "json_layout": args.json_layout,
+        "stop_on_empty_row": not args.no_stop_on_empty_row, "fill_merged": args.fill_merged,
+        "streaming": args.streaming, "incremental": args.incremental,
+        "timing_report": args.timing_report, "profile": args.profile, "sql_workers": args.sql_workers,
+    } for wbPath, outDir in zip(workbooks, OutputDirs(workbooks, outRoot))]
+    startedAt = datetime.now(timezone.utc).isoformat()  # run start 
+    started = time.perf_counter()  # wall timer 
+    if args.workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:  # bounded concurrency 
+            entries = list(pool.map(ProcessWorkbook, jobs))  # input order 
+    else:
+        entries = [ProcessWorkbook(job) for job in jobs]  # serial 
+    for e in entries:
+        status = f"ERROR {e['error']}" if e["error"] else f"{len(e['tables'])} tables"  # one line per workbook 
+        print(f"{e['workbook']}: {status} ({e['timings']['total']:.2f}s)")  # progress 
+    manifest = {  # run manifest 
+        "started_at": startedAt,  # UTC start 
+        "elapsed": round(time.perf_counter() - started, 6),  # seconds 
+        "pattern": pattern,  # header pattern 
+        "formats": formats,  # exports 
+        "workers": args.workers,  # concurrency 
+        "workbooks": entries,  # per-workbook details 
+        "totals": {  # summary 
+            "workbooks": len(entries),
+            "failed": sum(1 for e in entries if e["error"]),
+            "tables": sum(len(e["tables"]) for e in entries),
+            "rows": sum(t["rows"] for e in entries for t in e["tables"]),
+        },
+    }
+    manifestPath = Path(args.manifest) if args.manifest else outRoot / "manifest.json"  # manifest path 
+    manifestPath.parent.mkdir(parents=True, exist_ok=True)  # ensure dir 
+    manifestPath.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")  # write manifest 
+    return 1 if manifest["totals"]["failed"] else 0  # non-zero on any failure 
+
+if __name__ == "__main__":
+    sys.exit(Main())  # run CLI 
@@ -1,11 +1,15 @@
 # ddl_module.py
 
 from pathlib import Path  # FS paths
-from typing import Dict, Any, List, Optional  # typing
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple  # typing
 import json  # JSON read
 import re  # regex
+from itertools import repeat  # constant column for missing keys
+from table_module import ColumnarTable  # compact table object
+from instrumentation_module import Stage, CountFile  # timing hooks, no-ops when disabled
 
 MaxIdentLen = 30  # Oracle identifier length limit 
+DdlColumns = ("COLUMN NAME", "DATA TYPE", "NULL", "DEFAULT", "PK", "DESCRIPTION", "COMMENTS")  # spec columns read by GenerateTableDdl 
 
 def SanitizeIdentifier(name: str) -> str:
     s = re.sub(r"\s+", "_", name.strip())  # spaces → underscore 
@@ -48,32 +52,46 @@ def NormalizeDefault(defaultValue: Any, dataType: str) -> Optional[str]:
         return "1" if s.casefold() == "true" else "0"  # boolean as 1/0 
     return OracleQuoteLiteral(s)  # fallback quoted 
 
+def _SpecColumn(tableObj: Dict[str, Any], key: str, default=None) -> Iterable[Any]:
+    if not isinstance(tableObj, ColumnarTable):
+        return (r.get(key, default) for r in tableObj.get("rows", []))  # plain row dicts may be ragged: missing key → default per row 
+    column = tableObj.Column(key)  # column values 
+    return column if column is not None else repeat(default, tableObj.RowCount())  # missing key → default 
+
+def TableColumns(tableObj: Dict[str, Any]) -> List[Dict[str, Any]]:
+    Columns: List[Dict[str, Any]] = []  # column definitions 
+    def Col(key: str, default=None):
+        return _SpecColumn(tableObj, key, default)  # no pivot for plain dicts 
+    for RawColName, DataTypeVal, NullFlag, DefaultVal, PkFlag, Description in zip(Col("COLUMN NAME"), Col("DATA TYPE", "VARCHAR2(4000)"), Col("NULL"), Col("DEFAULT"), Col("PK"), Col("DESCRIPTION")):  # each Excel-defined column 
+        if not RawColName:
+            continue  # skip invalid row 
+        DataType = str(DataTypeVal).strip()  # Oracle datatype 
+        Columns.append({  # one column definition 
+            "name": SanitizeIdentifier(str(RawColName)),  # sanitized column name 
+            "raw_name": str(RawColName),  # label in the Excel spec 
+            "data_type": DataType,  # Oracle datatype 
+            "default": NormalizeDefault(DefaultVal, DataType),  # default expression or None 
+            "not_null": str(NullFlag).strip().casefold() in {"no", "n", "false", "0"},  # evaluate not-null 
+            "pk": IsTrue(PkFlag),  # primary key member 
+            "description": str(Description) if Description and str(Description).strip() else None,  # column comment 
+        })
+    return Columns  # definitions in spec order 
+
 def GenerateTableDdl(tableObj: Dict[str, Any], schema: str) -> str:
     RawTableName = str(tableObj["table_name"])  # raw name 
     TableName = SanitizeIdentifier(RawTableName)  # sanitized table name 
-    Rows = tableObj["rows"]  # data rows 
     ColumnDefs: List[str] = []  # column definitions 
     PkCols: List[str] = []  # PK columns 
     ColumnComments: List[str] = []  # comments on columns 
-    def Get(row: Dict[str, Any], key: str, default=None):
-        return row.get(key, default)  # safe get 
-    for r in Rows:  # each Excel-defined column 
-        RawColName = Get(r, "COLUMN NAME")  # column name 
-        if not RawColName:
-            continue  # skip invalid row 
-        ColName = SanitizeIdentifier(str(RawColName))  # sanitized column name 
-        DataType = str(Get(r, "DATA TYPE", "VARCHAR2(4000)")).strip()  # Oracle datatype 
-        NullFlag = Get(r, "NULL")  # NULL flag 
-        NotNull = str(NullFlag).strip().casefold() in {"no", "n", "false", "0"}  # evaluate not-null 
-        DefaultExpr = NormalizeDefault(Get(r, "DEFAULT"), DataType)  # default expression 
-        DefaultClause = f" DEFAULT {DefaultExpr}" if DefaultExpr is not None else ""  # default clause 
-        NullClause = " NOT NULL" if NotNull else ""  # nullability clause 
-        ColumnDefs.append(f"  {ColName} {DataType}{DefaultClause}{NullClause}")  # append column line 
-        if IsTrue(Get(r, "PK")): # if primary key
+    for Column in TableColumns(tableObj):  # each Excel-defined column 
+        ColName = Column["name"]  # sanitized column name 
+        DefaultClause = f" DEFAULT {Column['default']}" if Column["default"] is not None else ""  # default clause 
+        NullClause = " NOT NULL" if Column["not_null"] else ""  # nullability clause 
+        ColumnDefs.append(f"  {ColName} {Column['data_type']}{DefaultClause}{NullClause}")  # append column line 
+        if Column["pk"]: # if primary key
             PkCols.append(ColName)  # collect PK column 
-        Description = Get(r, "DESCRIPTION")  # column description 
-        if Description and str(Description).strip():
-            Txt = str(Description).replace("'", "''")  # escape quotes 
+        if Column["description"] is not None:
+            Txt = Column["description"].replace("'", "''")  # escape quotes 
             ColumnComments.append(f"COMMENT ON COLUMN {schema}.{TableName}.{ColName} IS '{Txt}';")  # comment line 
     DdlLines: List[str] = []  # final DDL 
     DdlLines.append(f"CREATE TABLE {schema}.{TableName} (")  # create table start 
@@ -86,7 +104,7 @@ def GenerateTableDdl(tableObj: Dict[str, Any], schema: str) -> str:
     # optional table comment inferred from uniform COMMENTS 
     TableComment = tableObj.get("comments")  # explicit comment if provided 
     if not TableComment:
-        CommentsVals = {str(r.get("COMMENTS")).strip() for r in Rows if r.get("COMMENTS")}  # unique comments 
+        CommentsVals = {str(v).strip() for v in _SpecColumn(tableObj, "COMMENTS") if v}  # unique comments 
         if len(CommentsVals) == 1:
             TableComment = CommentsVals.pop()  # use if unique 
     if TableComment:
@@ -95,19 +113,145 @@ def GenerateTableDdl(tableObj: Dict[str, Any], schema: str) -> str:
     DdlLines.extend(ColumnComments)  # append column comments 
     return "\n".join(DdlLines) + "\n"  # final DDL string 
 
-def WriteAllDdls(tables: List[Dict[str, Any]], schemaBySheet: Dict[str, str], outDir: Path):
-    outDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
-    allDdls: List[str] = []  # aggregate ddl 
-    for t in tables:  # per-table 
-        sheetName = t.get("sheet", "")  # source sheet 
-        schema = schemaBySheet.get(sheetName, next(iter(schemaBySheet.values())))  # schema by sheet or default 
-        rawName = str(t["table_name"])  # raw table name #
-        fileStem = SanitizeIdentifier(rawName) or "TABLE"  # filename stem 
-        sqlPath = outDir / f"{fileStem}.sql"  # file path 
-        ddl = GenerateTableDdl(t, schema)  # generate DDL 
+def SchemaForTable(t: Dict[str, Any], schemaBySheet: Dict[str, str]) -> str:
+    sheetName = t.get("sheet", "")  # source sheet 
+    return schemaBySheet.get(sheetName, next(iter(schemaBySheet.values())))  # schema by sheet or default 
+
+def DdlFileName(t: Dict[str, Any]) -> str:
+    rawName = str(t["table_name"])  # raw table name #
+    fileStem = SanitizeIdentifier(rawName) or "TABLE"  # filename stem 
+    return f"{fileStem}.sql"  # file name 
+
+def _WriteDdlFile(sqlPath: Path, ddl: str):
+    with Stage("write_ddl"):
         sqlPath.write_text(ddl, encoding="utf-8")  # write 
-        allDdls.append(ddl)  # collect 
-    (outDir / "_ALL_TABLES.sql").write_text("\n".join(allDdls), encoding="utf-8")  # aggregate file 
+    CountFile(sqlPath)  # bytes + files counters 
+
+class DdlWriter:
+    def __init__(self, schemaBySheet: Dict[str, str], outDir: Path, maxWorkers: int = 1, bufferSize: int = 1 << 20):
+        outDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+        self.SchemaBySheet = schemaBySheet  # schema map 
+        self.OutDir = outDir  # sql folder 
+        self.AllPath = outDir / "_ALL_TABLES.sql"  # aggregate file 
+        self.AllFile = open(self.AllPath, "w", encoding="utf-8", buffering=bufferSize)  # appended table by table 
+        self.Count = 0  # tables written 
+        self.Pool = None  # per-table file writers 
+        self.Pending: Dict[str, Any] = {}  # file name → last write future 
+        if maxWorkers > 1:
+            from concurrent.futures import ThreadPoolExecutor  # lazy import 
+            self.Pool = ThreadPoolExecutor(max_workers=maxWorkers)  # file writes overlap DDL generation 
+            self.MaxPending = maxWorkers * 4  # bounded in-flight DDL texts 
+
+    def Write(self, t: Dict[str, Any]) -> str:
+        with Stage("generate_ddl"):
+            ddl = GenerateTableDdl(t, SchemaForTable(t, self.SchemaBySheet))  # generate DDL 
+        with Stage("write_ddl"):
+            self.AllFile.write(("\n" if self.Count else "") + ddl)  # same text as "\n".join of all DDLs 
+        self.Count += 1  # next table 
+        name = DdlFileName(t)  # per-table file 
+        if self.Pool is None:
+            _WriteDdlFile(self.OutDir / name, ddl)  # serial write 
+            return ddl  # DDL text 
+        previous = self.Pending.pop(name, None)  # same file name as an earlier table 
+        if previous is not None:
+            previous.result()  # keep "last table wins" like the serial writer 
+        if len(self.Pending) >= self.MaxPending:
+            oldest = next(iter(self.Pending))  # first submitted 
+            self.Pending.pop(oldest).result()  # wait, surface errors 
+        self.Pending[name] = self.Pool.submit(_WriteDdlFile, self.OutDir / name, ddl)  # write in background 
+        return ddl  # DDL text 
+
+    def Close(self):
+        try:
+            for future in self.Pending.values():
+                future.result()  # surface write errors 
+        finally:
+            self.Pending = {}  # nothing in flight 
+            if self.Pool is not None:
+                self.Pool.shutdown()  # wait for writers 
+            self.AllFile.close()  # flush aggregate file 
+            CountFile(self.AllPath)  # bytes + files counters 
+
+def WriteAllDdls(tables: Iterable[Dict[str, Any]], schemaBySheet: Dict[str, str], outDir: Path, maxWorkers: int = 1):
+    writer = DdlWriter(schemaBySheet, outDir, maxWorkers)  # streams _ALL_TABLES.sql 
+    try:
+        for t in tables:  # per-table 
+            writer.Write(t)  # write file + append to aggregate 
+    finally:
+        writer.Close()  # flush and wait for file writes 
+
+def WriteDdlsFromJson(jsonPath: Path, schemaBySheet: Dict[str, str], outDir: Path, maxWorkers: int = 1):
+    WriteAllDdls(IterTablesFromJson(jsonPath, DdlColumns), schemaBySheet, outDir, maxWorkers)  # one table in memory, spec columns only 
+
+def _KeepColumnsHook(keepColumns: frozenset):
+    def Hook(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        if any(k == "table_name" for k, _ in pairs):
+            return dict(pairs)  # table object: keep metadata 
+        return {k: v for k, v in pairs if k in keepColumns}  # row object: drop unused cells while decoding 
+    return Hook  # object_pairs_hook 
+
+JsonSeparators = re.compile(r"[\s,]*")  # whitespace and commas between array items 
+
+def _IterJsonArray(f, chunkSize: int = 1 << 16, keepColumns: Optional[frozenset] = None) -> Iterator[Any]:
+    decoder = json.JSONDecoder(object_pairs_hook=_KeepColumnsHook(keepColumns)) if keepColumns is not None else json.JSONDecoder()  # incremental decoding via raw_decode 
+    buffer = ""  # unparsed text 
+    idx = 0  # parse position in buffer, items before it are done 
+    eof = False  # source exhausted 
+    while True:
+        idx = JsonSeparators.match(buffer, idx).end()  # skip separators without copying the buffer 
+        if buffer.startswith("]", idx):
+            return  # end of array 
+        try:
+            item, idx = decoder.raw_decode(buffer, idx)  # try next complete item 
+        except json.JSONDecodeError:
+            if eof:
+                raise  # truncated/invalid document 
+            if idx > chunkSize:
+                buffer = buffer[idx:]  # drop parsed text once per chunk, not per item 
+                idx = 0  # restart at the pending item 
+            chunk = f.read(max(chunkSize, len(buffer) - idx))  # grow read to keep decoding linear 
+            eof = not chunk  # no more data 
+            buffer += chunk  # extend buffer 
+            continue
+        yield item  # one table 
+
+def _IterNdjsonTables(f, keepColumns: Optional[frozenset] = None) -> Iterator[ColumnarTable]:
+    table: Optional[ColumnarTable] = None  # table being assembled 
+    keep: Optional[List[int]] = None  # header positions kept 
+    for line in f:  # one record per line 
+        if not line.strip():
+            continue  # blank line 
+        record = json.loads(line)  # decode record 
+        if record.pop("record", None) == "table":  # table header record 
+            if table is not None:
+                yield table  # previous table complete 
+            if keepColumns is not None:
+                keep = [i for i, h in enumerate(record["header"]) if h in keepColumns]  # positions of used columns 
+                record["header"] = [record["header"][i] for i in keep]  # reduced header 
+            table = ColumnarTable.From(record)  # table metadata, rows filled by row records 
+            continue
+        values = record["values"]  # row values in header order 
+        table.AppendRow(values if keep is None else [values[i] if i < len(values) else None for i in keep])  # used columns only 
+    if table is not None:
+        yield table  # last table 
+
+def IterTablesFromJson(jsonPath: Path, keepColumns: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    keep = frozenset(keepColumns) if keepColumns is not None else None  # row cells to keep (None = all) 
+    with open(jsonPath, "r", encoding="utf-8") as f:  # text stream 
+        head = f.read(1)  # first char decides layout 
+        while head and head.isspace():
+            head = f.read(1)  # skip leading whitespace 
+        if head == "[":  # JSON array (indented or compact) 
+            for t in _IterJsonArray(f, keepColumns=keep):  # table by table 
+                if keep is not None:
+                    t["header"] = [h for h in t.get("header", []) if h in keep]  # header matches the reduced rows 
+                yield t  # one table 
+        elif head == "{":  # NDJSON records 
+            f.seek(0)  # reread from start 
+            yield from _IterNdjsonTables(f, keep)  # table by table 
+        elif head:
+            raise ValueError(f"Unsupported JSON layout in {jsonPath}")  # not a tables file 
 
 def LoadTablesFromJson(jsonPath: Path) -> List[Dict[str, Any]]:
-    return json.loads(jsonPath.read_text(encoding="utf-8"))  # load tables list 
+    with Stage("read_json"):
+        return list(IterTablesFromJson(jsonPath))  # load tables list 
@@ -1,33 +1,186 @@
 # extractor_module.py
 
 import json  # JSON read/write
+import os  # atomic replace
+import time  # stage clock while streaming
+from contextlib import nullcontext  # uninstrumented workers
+from bisect import bisect_right  # sorted lookups
+from weakref import WeakKeyDictionary  # per-sheet caches
 from pathlib import Path  # FS paths
-from typing import List, Tuple, Dict, Any, Optional  # typing
+from typing import List, Tuple, Dict, Any, Optional, Iterable, Iterator, Sequence, Callable, Union  # typing
 from openpyxl import load_workbook  # Excel reader
 from openpyxl.worksheet.worksheet import Worksheet  # typing hint
+from table_module import ColumnarTable  # compact table object
+from instrumentation_module import Stage, Count, CountFile, Current, Instrumented  # timing hooks, no-ops when disabled
+
+ProgressCallback = Callable[[str, int], None]  # (event, count): "scan", "row", "table", "sheet"; may raise ExtractionCancelled 
+
+class ExtractionCancelled(Exception):
+    pass  # raised from a progress callback to stop extraction between rows/tables 
 
 def NormalizeString(value: Any) -> str:
     value = "" if value is None else str(value).strip()  # normalize None to empty and trim spaces 
     value = " ".join(value.split())  # collapse multiple spaces 
     return value.casefold()  # case-insensitive compare 
 
-def FindHeaderPositions(sheet: Worksheet, pattern: List[str]) -> List[Tuple[int, int]]:
-    normalizedPattern = [NormalizeString(x) for x in pattern]  # normalize pattern tokens 
+def NormalizeRow(values: Tuple[Any, ...]) -> List[str]:
+    return [NormalizeString(v) for v in values]  # normalize each cell exactly once 
+
+def MatchHeaderInRow(normalizedRow: List[str], normalizedPattern: List[str]) -> List[int]:
     columnsCount = len(normalizedPattern)  # number of header cells 
-    positions: List[Tuple[int, int]] = []  # collection of header hits 
-    maxRow = sheet.max_row  # openpyxl estimated last row 
+    lastStart = len(normalizedRow) - columnsCount  # last viable 0-based start column 
+    if columnsCount == 0 or lastStart < 0:
+        return []  # pattern cannot fit in row 
+    firstToken = normalizedPattern[0]  # index token 
+    restPattern = normalizedPattern[1:]  # tokens checked after a first-token hit 
+    hits: List[int] = []  # 0-based start columns 
+    start = 0  # search offset 
+    while True:
+        try:
+            col = normalizedRow.index(firstToken, start, lastStart + 1)  # next candidate start 
+        except ValueError:
+            break  # no more candidates in row 
+        if normalizedRow[col + 1:col + columnsCount] == restPattern:  # verify remaining tokens 
+            hits.append(col)  # store match 
+        start = col + 1  # continue after candidate 
+    return hits  # all starts in row 
+
+class HeaderMatcher:
+    def __init__(self, patterns: List[List[str]]):
+        self.Patterns = [list(p) for p in patterns]  # patterns as given (table tags) 
+        self.Normalized = [[NormalizeString(x) for x in p] for p in self.Patterns]  # normalized once 
+        self.Goto: List[Dict[str, int]] = [{}]  # trie over cell tokens, node 0 = root 
+        self.Fail: List[int] = [0]  # Aho-Corasick failure links 
+        self.Out: List[List[int]] = [[]]  # pattern indexes ending at each node 
+        for i, tokens in enumerate(self.Normalized):
+            if not tokens:
+                continue  # empty pattern never matches 
+            node = 0  # walk/extend the trie 
+            for token in tokens:
+                nxt = self.Goto[node].get(token)  # existing edge 
+                if nxt is None:
+                    nxt = len(self.Goto)  # new node 
+                    self.Goto.append({})
+                    self.Fail.append(0)
+                    self.Out.append([])
+                    self.Goto[node][token] = nxt  # add edge 
+                node = nxt  # descend 
+            if not self.Out[node]:
+                self.Out[node].append(i)  # same normalized pattern twice: first one wins 
+        order = list(self.Goto[0].values())  # BFS from depth 1, whose failure link is the root 
+        for node in order:
+            for token, child in self.Goto[node].items():
+                order.append(child)  # visit next level later 
+                f = self.Fail[node]  # longest proper suffix state 
+                while f and token not in self.Goto[f]:
+                    f = self.Fail[f]  # fall back 
+                target = self.Goto[f].get(token, 0)  # suffix continuation 
+                self.Fail[child] = target if target != child else 0  # depth-1 nodes fail to root 
+                self.Out[child] = self.Out[child] + self.Out[self.Fail[child]]  # shorter patterns ending here too 
+        self.FirstTokens = frozenset(self.Goto[0])  # cheap row prefilter 
+        self.Lengths = [len(t) for t in self.Normalized]  # pattern widths 
+        distinct = {i for node in self.Out for i in node}  # patterns the automaton reports 
+        self.Single = distinct.pop() if len(distinct) == 1 else None  # common case: one pattern 
+
+    def Match(self, normalizedRow: List[str]) -> List[Tuple[int, int]]:
+        if self.Single is not None:
+            return [(col, self.Single) for col in MatchHeaderInRow(normalizedRow, self.Normalized[self.Single])]  # one pattern: C-level list.index scan 
+        if self.FirstTokens.isdisjoint(normalizedRow):
+            return []  # no pattern can start in this row (most rows) 
+        goto, fail, out, lengths = self.Goto, self.Fail, self.Out, self.Lengths  # locals for the cell loop 
+        hits: List[Tuple[int, int]] = []  # (0-based start column, pattern index) 
+        node = 0  # automaton state 
+        for col, token in enumerate(normalizedRow):  # one pass over the row for all patterns 
+            while node and token not in goto[node]:
+                node = fail[node]  # follow failure links 
+            node = goto[node].get(token, 0)  # advance 
+            for i in out[node]:
+                hits.append((col - lengths[i] + 1, i))  # pattern i ends at col 
+        hits.sort()  # left to right, then pattern order 
+        return hits  # every occurrence of every pattern 
+
+PatternSpec = Union[List[str], List[List[str]], HeaderMatcher]  # one pattern, several patterns, or a compiled matcher 
+
+def CompileHeaderPatterns(pattern: PatternSpec) -> HeaderMatcher:
+    if isinstance(pattern, HeaderMatcher):
+        return pattern  # already compiled 
+    if pattern and all(isinstance(p, (list, tuple)) for p in pattern):
+        return HeaderMatcher(list(pattern))  # several patterns 
+    return HeaderMatcher([list(pattern)])  # single pattern 
+
+def FindHeaderMatches(sheet: Worksheet, pattern: PatternSpec, progress: Optional[ProgressCallback] = None) -> List[Tuple[int, int, int]]:
+    matcher = CompileHeaderPatterns(pattern)  # normalize all patterns once 
+    matches: List[Tuple[int, int, int]] = []  # (row, col, pattern index) 
     maxCol = sheet.max_column  # openpyxl estimated last column 
-    for row in range(1, maxRow + 1):  # scan rows 
-        for col in range(1, maxCol - columnsCount + 2):  # scan viable columns 
-            window = [NormalizeString(sheet.cell(row, col + k).value) for k in range(columnsCount)]  # read window 
-            if window == normalizedPattern:  # match found 
-                positions.append((row, col))  # store top-left header cell 
-    return positions  # all positions 
+    rowIdx = 0  # rows scanned 
+    for rowIdx, values in enumerate(sheet.iter_rows(max_col=maxCol, values_only=True), start=1):  # single pass over rows 
+        if progress is not None:
+            progress("scan", 1)  # row scanned 
+        for col, i in matcher.Match(NormalizeRow(values)):  # all patterns in one pass 
+            matches.append((rowIdx, col + 1, i))  # top-left header cell (1-based) + pattern 
+    Count("rows_normalized", rowIdx)  # counted once per sheet, not per row 
+    Count("cells_read", rowIdx * maxCol)  # rows × scanned width 
+    return matches  # all matches 
+
+def FindHeaderPositions(sheet: Worksheet, pattern: PatternSpec, progress: Optional[ProgressCallback] = None) -> List[Tuple[int, int]]:
+    return [(row, col) for row, col, _ in FindHeaderMatches(sheet, pattern, progress)]  # positions only 
+
+def ReadMergedRanges(sheet) -> List[Tuple[int, int, int, int]]:
+    if hasattr(sheet, "MergedRanges"):  # session_module.CachedSheet 
+        return list(sheet.MergedRanges)  # read once per cached sheet 
+    if getattr(sheet, "merged_cells", None) is not None:  # full-mode worksheet 
+        return [(m.min_row, m.min_col, m.max_row, m.max_col) for m in sheet.merged_cells.ranges]  # (minRow, minCol, maxRow, maxCol) 
+    from xml.etree.ElementTree import iterparse  # lazy import 
+    from openpyxl.utils.cell import range_boundaries  # "A1:D1" → bounds 
+    ranges: List[Tuple[int, int, int, int]] = []  # collected ranges 
+    with sheet._get_source() as src:  # read-only sheets do not parse <mergeCells>, scan the xml part 
+        for _, elem in iterparse(src):  # streaming xml events 
+            if elem.tag.endswith("}mergeCell"):  # merged range element 
+                minCol, minRow, maxCol, maxRow = range_boundaries(elem.get("ref"))  # parse ref 
+                ranges.append((minRow, minCol, maxRow, maxCol))  # store bounds 
+            elem.clear()  # keep memory flat 
+    return ranges  # all merged ranges 
+
+class MergedCellIndex:
+    def __init__(self, ranges: Iterable[Tuple[int, int, int, int]]):
+        buckets: Dict[int, List[Tuple[int, int, int, int]]] = {}  # row → ranges covering it 
+        for bounds in ranges:  # each (minRow, minCol, maxRow, maxCol) 
+            for row in range(bounds[0], bounds[2] + 1):  # every covered row 
+                buckets.setdefault(row, []).append(bounds)  # bucket by row 
+        self.Rows: Dict[int, Tuple[List[int], List[Tuple[int, int, int, int]]]] = {}  # row → (sorted minCols, ranges) 
+        for row, bucket in buckets.items():
+            bucket.sort(key=lambda b: b[1])  # merged ranges never overlap, order by first column 
+            self.Rows[row] = ([b[1] for b in bucket], bucket)  # bisect keys + ranges 
+        self.AnchorsByRow: Dict[int, List[int]] = {}  # anchor row → anchor columns 
+        for bounds in set(b for bucket in buckets.values() for b in bucket):  # each range once 
+            self.AnchorsByRow.setdefault(bounds[0], []).append(bounds[1])  # top-left cell 
+
+    def Anchor(self, row: int, col: int) -> Optional[Tuple[int, int]]:
+        bucket = self.Rows.get(row)  # ranges crossing this row 
+        if bucket is None:
+            return None  # row has no merges 
+        minCols, ranges = bucket  # bisect keys + ranges 
+        i = bisect_right(minCols, col) - 1  # last range starting at or before col 
+        if i >= 0 and col <= ranges[i][3]:  # col inside that range 
+            return ranges[i][0], ranges[i][1]  # anchor (row, col) 
+        return None  # not merged 
+
+_MergedIndexBySheet: "WeakKeyDictionary[Any, MergedCellIndex]" = WeakKeyDictionary()  # one index per worksheet 
+
+def GetMergedCellIndex(sheet) -> MergedCellIndex:
+    index = _MergedIndexBySheet.get(sheet)  # cached index 
+    if index is None:
+        with Stage("merged_index"):
+            ranges = ReadMergedRanges(sheet)  # merged ranges of the sheet 
+            index = MergedCellIndex(ranges)  # build once per sheet 
+        Count("merged_ranges_scanned", len(ranges))  # ranges indexed 
+        _MergedIndexBySheet[sheet] = index  # cache 
+    return index  # row-bucketed lookup 
 
 def ResolveMergedCellValue(sheet: Worksheet, row: int, col: int):
-    for merged in sheet.merged_cells.ranges:  # iterate merged ranges 
-        if merged.min_row <= row <= merged.max_row and merged.min_col <= col <= merged.max_col:  # inside 
-            return sheet.cell(merged.min_row, merged.min_col).value  # return anchor value 
+    anchor = GetMergedCellIndex(sheet).Anchor(row, col)  # O(log n) lookup 
+    if anchor is not None:  # inside a merged range 
+        return sheet.cell(*anchor).value  # return anchor value 
     return sheet.cell(row, col).value  # not merged 
 
 def GetTableName(sheet: Worksheet, headerRow: int, headerCol: int, columnsCount: int) -> str:
@@ -46,14 +199,24 @@ def RowIsEmpty(sheet: Worksheet, row: int, startCol: int, endCol: int) -> bool:
             return False  # not empty 
     return True  # empty row 
 
-def ReadTable(sheet: Worksheet, headerStart: Tuple[int, int], pattern: List[str], stopOnEmptyRow: bool = True) -> Dict[str, Any]:
+def FillMergedValues(sheet: Worksheet, row: int, col0: int, rowValues: List[Any]) -> List[Any]:
+    index = GetMergedCellIndex(sheet)  # per-sheet merged index 
+    for k, value in enumerate(rowValues):  # each window cell 
+        if value is None:  # only covered cells are blank 
+            anchor = index.Anchor(row, col0 + k)  # merged anchor 
+            if anchor is not None:
+                rowValues[k] = sheet.cell(*anchor).value  # anchor value 
+    return rowValues  # filled values 
+
+def ReadTable(sheet: Worksheet, headerStart: Tuple[int, int], pattern: List[str], stopOnEmptyRow: bool = True, fillMerged: bool = False, progress: Optional[ProgressCallback] = None, nextHeaderRow: Optional[int] = None) -> ColumnarTable:
     row0, col0 = headerStart  # header top-left 
     columnsCount = len(pattern)  # header size 
     tableName = GetTableName(sheet, row0, col0, columnsCount)  # infer table name 
     header = [str(sheet.cell(row0, col0 + k).value).strip() for k in range(columnsCount)]  # header labels 
-    rows: List[Dict[str, Any]] = []  # collected rows 
+    table = ColumnarTable(tableName, header, sheet=sheet.title, startCell=(row0, col0))  # table object, data kept column-wise 
+    normalizedPattern = NormalizeRow(pattern)  # normalized once, not per row 
     row = row0 + 1  # first data row 
-    maxRow = sheet.max_row  # bottom bound 
+    maxRow = sheet.max_row if nextHeaderRow is None else min(sheet.max_row, nextHeaderRow - 1)  # bottom bound, another pattern's header ends the table 
     while row <= maxRow:  # scan downward 
         if RowIsEmpty(sheet, row, col0, col0 + columnsCount - 1):  # empty row in window 
             if stopOnEmptyRow:  # stop policy 
@@ -61,41 +224,321 @@ def ReadTable(sheet: Worksheet, headerStart: Tuple[int, int], pattern: List[str]
             row += 1  # skip empty row 
             continue  # next row 
         rowValues = [sheet.cell(row, col0 + k).value for k in range(columnsCount)]  # read row window 
-        if [NormalizeString(v) for v in rowValues] == [NormalizeString(v) for v in pattern]:  # next header 
+        if NormalizeRow(rowValues) == normalizedPattern:  # next header 
             break  # new table starts here 
-        rows.append({header[i]: rowValues[i] for i in range(columnsCount)})  # header→value mapping 
+        if fillMerged:
+            rowValues = FillMergedValues(sheet, row, col0, rowValues)  # fill merged cells from anchors 
+        table.AppendRow(rowValues)  # store row values 
+        if progress is not None:
+            progress("row", 1)  # row read 
         row += 1  # next row 
-    return {  # table object 
-        "table_name": tableName,  # table name 
-        "header": header,  # header labels 
-        "rows": rows,  # data rows 
-        "sheet": sheet.title,  # source sheet 
-        "start_cell": (row0, col0),  # header position (row, col) 1-based 
-    }
-
-def ExtractAllTables(excelPath: Path, pattern: List[str], sheetsToCheck: Optional[set] = None, stopOnEmptyRow: bool = True) -> List[Dict[str, Any]]:
-    workBook = load_workbook(excelPath, data_only=True)  # open workbook with computed values 
+    Count("rows_normalized", table.RowCount())  # data rows compared with the pattern 
+    Count("cells_read", (min(row, maxRow) - row0) * columnsCount)  # rows visited × header width 
+    return table  # table object 
+
+def ExtractAllTables(excelPath: Path, pattern: PatternSpec, sheetsToCheck: Optional[set] = None, stopOnEmptyRow: bool = True, streaming: bool = False, fillMerged: bool = False, maxWorkers: int = 1, progress: Optional[ProgressCallback] = None) -> List[ColumnarTable]:
+    if maxWorkers > 1:
+        return ExtractTablesParallel([excelPath], pattern, sheetsToCheck, stopOnEmptyRow, fillMerged, maxWorkers, progress)[0]  # one process per sheet 
+    if streaming:
+        return list(IterTables(excelPath, pattern, sheetsToCheck, stopOnEmptyRow, fillMerged, progress))  # read-only row pass 
+    with Stage("load_workbook"):
+        workBook = load_workbook(excelPath, data_only=True)  # open workbook with computed values 
     targetSheets = [n for n in workBook.sheetnames if (sheetsToCheck is None or n in sheetsToCheck)]  # filter sheets 
-    tables: List[Dict[str, Any]] = []  # accumulator 
+    matcher = CompileHeaderPatterns(pattern)  # patterns normalized once per run 
+    tagPattern = len(matcher.Patterns) > 1  # tables record their pattern only when there is a choice 
+    tables: List[ColumnarTable] = []  # accumulator 
     for name in targetSheets:  # each sheet 
         sheet = workBook[name]  # get worksheet 
-        headerPositions = FindHeaderPositions(sheet, pattern)  # locate header(s) 
-        for start in headerPositions:  # each header 
-            tables.append(ReadTable(sheet, start, pattern, stopOnEmptyRow=stopOnEmptyRow))  # parse table 
+        with Stage("find_headers"):
+            headerMatches = FindHeaderMatches(sheet, matcher, progress)  # locate header(s) 
+        headerRowsByCol: Dict[int, List[int]] = {}  # start column → header rows (any pattern), ascending 
+        for row, col, _ in headerMatches:
+            headerRowsByCol.setdefault(col, []).append(row)  # matches come in row order 
+        for row, col, i in headerMatches:  # each header 
+            rows = headerRowsByCol[col]  # headers in the same column 
+            k = bisect_right(rows, row)  # first header below this one 
+            with Stage("read_table"):
+                table = ReadTable(sheet, (row, col), matcher.Patterns[i], stopOnEmptyRow=stopOnEmptyRow, fillMerged=fillMerged, progress=progress, nextHeaderRow=rows[k] if k < len(rows) else None)  # parse table 
+            if tagPattern:
+                table.Pattern = matcher.Patterns[i]  # exported as "pattern" 
+            tables.append(table)  # keep table 
+            if progress is not None:
+                progress("table", 1)  # table found 
+        if progress is not None:
+            progress("sheet", 1)  # sheet done 
+    Count("sheets", len(targetSheets))  # sheets parsed 
+    Count("tables", len(tables))  # tables found 
     return tables  # all tables 
 
-def WriteTablesJson(tables: List[Dict[str, Any]], outputPath: Path):
-    outputPath.write_text(json.dumps(tables, ensure_ascii=False, indent=2), encoding="utf-8")  # write JSON 
+def _RowWindow(values: Sequence[Any], col0: int, columnsCount: int) -> List[Any]:
+    window = list(values[col0 - 1:col0 - 1 + columnsCount])  # header-wide slice 
+    return window + [None] * (columnsCount - len(window))  # pad short rows 
 
-def WriteTablesCsv(tables: List[Dict[str, Any]], outDir: Path):
-    outDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+def _IterSheetTables(sheet, pattern: PatternSpec, stopOnEmptyRow: bool, fillMerged: bool = False, progress: Optional[ProgressCallback] = None) -> Iterator[ColumnarTable]:
+    matcher = CompileHeaderPatterns(pattern)  # normalize pattern tokens once 
+    tagPattern = len(matcher.Patterns) > 1  # tables record their pattern only when there is a choice 
+    pending: List[Dict[str, Any]] = []  # tables in start order: {"table", "col0", "pattern", "open"} 
+    mergedIndex: Optional[MergedCellIndex] = GetMergedCellIndex(sheet) if fillMerged else None  # loaded up front only when filling 
+    anchorValues: Dict[Tuple[int, int], Any] = {}  # anchor values seen so far (fill mode) 
+    prevValues: Tuple[Any, ...] = ()  # previous row (title row candidate) 
+    inst = Current()  # timing hooks, None when disabled 
+    clock = time.perf_counter if inst is not None else None  # stage clock, paused while the consumer holds a table 
+    tRows = tFind = tRead = 0.0  # read_rows / find_headers / read_table seconds, reported at sheet end 
+    t0 = clock() if clock is not None else 0.0  # last checkpoint 
+    rowIdx = cells = tableCount = 0  # counters, reported once at sheet end 
+    try:
+        for rowIdx, values in enumerate(sheet.iter_rows(values_only=True), start=1):  # single pass over rows 
+            if clock is not None:
+                t1 = clock()  # checkpoint 
+                tRows += t1 - t0  # row parsed by openpyxl 
+                t0 = t1  # next segment starts here 
+            if progress is not None:
+                progress("scan", 1)  # row scanned 
+            normalizedRow = NormalizeRow(values)  # normalize row once 
+            hits = matcher.Match(normalizedRow)  # headers of any pattern starting on this row 
+            if clock is not None:
+                t1 = clock()  # checkpoint 
+                tFind += t1 - t0  # header scan 
+                t0 = t1  # next segment starts here 
+            if fillMerged:
+                for anchorCol in mergedIndex.AnchorsByRow.get(rowIdx, ()):  # remember anchors on this row 
+                    if anchorCol <= len(values):
+                        anchorValues[(rowIdx, anchorCol)] = values[anchorCol - 1]  # anchor value 
+            for state in pending:  # advance open tables 
+                if not state["open"]:
+                    continue  # already terminated 
+                col0 = state["col0"]  # table start column 
+                normalizedPattern = state["pattern"]  # the table's own header 
+                columnsCount = len(normalizedPattern)  # header size 
+                normalizedWindow = _RowWindow(normalizedRow, col0, columnsCount)  # normalized window 
+                if all(not v for v in normalizedWindow):  # empty row in window 
+                    if stopOnEmptyRow:  # stop policy 
+                        state["open"] = False  # end table 
+                    continue  # skip empty row 
+                if normalizedWindow == normalizedPattern or any(c + 1 == col0 for c, _ in hits):  # next header (own or another pattern) 
+                    state["open"] = False  # new table starts here 
+                    continue
+                rowValues = _RowWindow(values, col0, columnsCount)  # raw window 
+                if fillMerged:
+                    for k, value in enumerate(rowValues):  # each window cell 
+                        anchor = mergedIndex.Anchor(rowIdx, col0 + k) if value is None else None  # merged anchor 
+                        if anchor is not None:
+                            rowValues[k] = anchorValues.get(anchor)  # anchor value 
+                state["table"].AppendRow(rowValues)  # store row values 
+                if progress is not None:
+                    progress("row", 1)  # row read 
+            if clock is not None:
+                t1 = clock()  # checkpoint 
+                tRead += t1 - t0  # rows appended to open tables 
+                t0 = t1  # next segment starts here 
+            for c, i in hits:  # headers of any pattern starting on this row 
+                col0 = c + 1  # 1-based column 
+                columnsCount = matcher.Lengths[i]  # header size 
+                titleValues = _RowWindow(prevValues, col0, columnsCount)  # title row above header 
+                tableName = None  # resolved title 
+                for k, value in enumerate(titleValues):  # same rule as GetTableName 
+                    if not (value and str(value).strip()) and rowIdx > 1:  # empty cell may belong to a merged range 
+                        if mergedIndex is None:
+                            mergedIndex = GetMergedCellIndex(sheet)  # lazy load 
+                        anchor = mergedIndex.Anchor(rowIdx - 1, col0 + k)  # covering range anchor 
+                        if anchor in anchorValues:
+                            value = anchorValues[anchor]  # seen while streaming 
+                        elif anchor is not None:
+                            value = prevValues[anchor[1] - 1] if anchor[0] == rowIdx - 1 and anchor[1] <= len(prevValues) else sheet.cell(*anchor).value  # anchor value 
+                    if value and str(value).strip():  # first non-empty wins 
+                        tableName = str(value).strip()  # use as table name 
+                        break
+                header = [str(v).strip() for v in _RowWindow(values, col0, columnsCount)]  # header labels 
+                table = ColumnarTable(tableName or sheet.title, header, sheet=sheet.title, startCell=(rowIdx, col0), pattern=matcher.Patterns[i] if tagPattern else None)  # table name or sheet fallback 
+                pending.append({"table": table, "col0": col0, "pattern": matcher.Normalized[i], "open": True})  # track until terminated 
+                if progress is not None:
+                    progress("table", 1)  # table found 
+            if clock is not None and hits:
+                t1 = clock()  # checkpoint 
+                tFind += t1 - t0  # titles + new tables 
+                t0 = t1  # next segment starts here 
+            while pending and not pending[0]["open"]:  # emit finished tables in start order 
+                table = pending.pop(0)["table"]  # table ready 
+                tableCount += 1  # emitted 
+                yield table  # table ready 
+                if clock is not None:
+                    t0 = clock()  # resume clock, consumer time excluded 
+            prevValues = values  # remember title row candidate 
+            cells += len(values)  # row width as read 
+    finally:
+        if inst is not None:
+            inst.AddTime("read_rows", tRows)  # openpyxl row parsing (xml in read-only mode) 
+            inst.AddTime("find_headers", tFind)  # normalize + match + table titles 
+            inst.AddTime("read_table", tRead)  # row windows appended to open tables 
+    if inst is not None:
+        inst.Count("rows_normalized", rowIdx)  # every row is normalized once 
+        inst.Count("cells_read", cells)  # cells streamed 
+        inst.Count("tables", tableCount + len(pending))  # tables found 
+        inst.Count("sheets")  # sheet done 
+    for state in pending:  # sheet end closes everything 
+        yield state["table"]  # remaining tables 
+    if progress is not None:
+        progress("sheet", 1)  # sheet done 
+
+def IterTables(excelPath: Path, pattern: PatternSpec, sheetsToCheck: Optional[set] = None, stopOnEmptyRow: bool = True, fillMerged: bool = False, progress: Optional[ProgressCallback] = None, session=None) -> Iterator[ColumnarTable]:
+    with Stage("load_workbook"):
+        workBook = session.Open(excelPath) if session is not None else load_workbook(excelPath, read_only=True, data_only=True)  # cached rows (session_module) or streaming workbook with computed values 
+    try:
+        for name in workBook.sheetnames:  # each sheet in workbook order 
+            if sheetsToCheck is not None and name not in sheetsToCheck:
+                continue  # sheet not selected 
+            yield from _IterSheetTables(workBook[name], pattern, stopOnEmptyRow, fillMerged, progress)  # tables as soon as they end 
+    finally:
+        workBook.close()  # release archive handle 
+
+def _ExtractSheetTables(task: Tuple[str, str, PatternSpec, bool, bool, bool]) -> Tuple[List[ColumnarTable], Optional[Dict[str, Any]]]:
+    excelPath, sheetName, pattern, stopOnEmptyRow, fillMerged, instrumented = task  # worker arguments 
+    with (Instrumented() if instrumented else nullcontext()) as inst:  # worker-local timings when the parent run is instrumented 
+        with Stage("load_workbook"):
+            workBook = load_workbook(excelPath, read_only=True, data_only=True)  # each worker opens its own read-only handle 
+        try:
+            tables = list(_IterSheetTables(workBook[sheetName], pattern, stopOnEmptyRow, fillMerged))  # columnar tables pickle compactly 
+        finally:
+            workBook.close()  # release archive handle 
+    return tables, (inst.Report() if inst is not None else None)  # report travels back with the tables 
+
+def ExtractTablesParallel(excelPaths: List[Path], pattern: PatternSpec, sheetsToCheck: Optional[set] = None, stopOnEmptyRow: bool = True, fillMerged: bool = False, maxWorkers: Optional[int] = None, progress: Optional[ProgressCallback] = None) -> List[List[ColumnarTable]]:
+    import multiprocessing  # start method 
+    from concurrent.futures import ProcessPoolExecutor  # lazy import 
+    matcher = CompileHeaderPatterns(pattern)  # compiled once, pickled to the workers 
+    inst = Current()  # worker reports are merged into the parent run 
+    tasks: List[Tuple[str, str, PatternSpec, bool, bool, bool]] = []  # (workbook, sheet) jobs in serial order 
+    taskWorkbook: List[int] = []  # workbook slot of each job 
+    for slot, excelPath in enumerate(excelPaths):  # each workbook 
+        workBook = load_workbook(excelPath, read_only=True)  # sheet names only 
+        sheetNames = list(workBook.sheetnames)  # workbook order 
+        workBook.close()  # release handle 
+        for name in sheetNames:
+            if sheetsToCheck is None or name in sheetsToCheck:  # sheet selected 
+                tasks.append((str(excelPath), name, matcher, stopOnEmptyRow, fillMerged, inst is not None))  # one job per sheet 
+                taskWorkbook.append(slot)  # result slot 
+    results: List[List[ColumnarTable]] = [[] for _ in excelPaths]  # tables per workbook 
+    t0 = time.perf_counter()  # pool clock 
+    pool = ProcessPoolExecutor(max_workers=maxWorkers, mp_context=multiprocessing.get_context("spawn"))  # configurable pool; spawn, not fork: the GUI calls this from a worker thread 
+    try:
+        for slot, (tables, report) in zip(taskWorkbook, pool.map(_ExtractSheetTables, tasks)):  # map keeps submission order 
+            results[slot].extend(tables)  # position order within sheet 
+            if report is not None:
+                inst.Merge(report)  # worker stages (summed across processes) + counters 
+            if progress is not None:  # per-sheet granularity across processes 
+                progress("row", sum(t.RowCount() for t in tables))  # rows read 
+                progress("table", len(tables))  # tables found 
+                progress("sheet", 1)  # sheet done 
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)  # drop queued sheets on cancel/error 
+        raise
+    pool.shutdown()  # wait for workers 
+    if inst is not None:
+        inst.AddTime("parallel_extract", time.perf_counter() - t0)  # wall time across processes 
+    return results  # deterministic workbook/sheet/position order 
+
+JsonLayouts = ("indented", "compact", "ndjson")  # supported JSON output layouts 
+
+class JsonTablesWriter:
+    def __init__(self, outputPath: Path, layout: str = "indented", bufferSize: int = 1 << 20, default: Optional[Callable[[Any], Any]] = None):
+        if layout not in JsonLayouts:
+            raise ValueError(f"Unknown JSON layout: {layout}")  # invalid option 
+        self.Layout = layout  # output layout 
+        self.Indent = 2 if layout == "indented" else None  # indent width 
+        self.Separators = (",", ": ") if self.Indent else (",", ":")  # item/key separators 
+        self.Encoder = json.JSONEncoder(ensure_ascii=False, indent=self.Indent, separators=self.Separators, default=default)  # reused encoder, default converts non-JSON values 
+        self.Path = outputPath  # output file 
+        self.TempPath = outputPath.with_name(f".{outputPath.name}.tmp")  # written first, renamed over Path on Close 
+        self.File = open(self.TempPath, "w", encoding="utf-8", buffering=bufferSize)  # buffered output handle 
+        self.Count = 0  # tables written 
+        if layout != "ndjson":
+            self.File.write("[")  # open array 
+
+    def _Dumps(self, value: Any, level: int) -> str:
+        text = self.Encoder.encode(value)  # encode value 
+        return text.replace("\n", self._NewLine(level)) if self.Indent else text  # nest at current level 
+
+    def _NewLine(self, level: int) -> str:
+        return "\n" + " " * (self.Indent * level) if self.Indent else ""  # line break + indentation 
+
+    def Write(self, t: Dict[str, Any]):
+        with Stage("write_json"):
+            self._Write(t)  # append table 
+
+    def _Write(self, t: Dict[str, Any]):
+        t = ColumnarTable.From(t)  # work on columns 
+        f = self.File  # output handle 
+        if self.Layout == "ndjson":
+            meta = {"record": "table", **{k: t[k] for k in t if k != "rows"}}  # table header record 
+            f.write(self._Dumps(meta, 0) + "\n")  # one line per record 
+            for values in t.IterRowValues():  # one record per row 
+                f.write(self._Dumps({"record": "row", "values": list(values)}, 0) + "\n")  # row values in header order 
+            self.Count += 1  # next table 
+            return
+        f.write(("," if self.Count else "") + self._NewLine(1) + "{")  # open table object 
+        for i, key in enumerate(t):  # same key order as the table object 
+            f.write(("," if i else "") + self._NewLine(2) + self._Dumps(key, 2) + self.Separators[1])  # key 
+            if key == "rows" and t.RowCount():
+                keys, positions = t.RowLayout()  # row object keys + source columns 
+                keyTexts = [self._NewLine(4) + self._Dumps(k, 4) + self.Separators[1] for k in keys]  # encoded once per table 
+                f.write("[")  # open rows 
+                for j, values in enumerate(zip(*(t.Columns[p] for p in positions))):  # row by row from columns 
+                    body = ",".join(kt + self._Dumps(v, 4) for kt, v in zip(keyTexts, values))  # row members 
+                    f.write(("," if j else "") + self._NewLine(3) + "{" + body + self._NewLine(3) + "}")  # row object 
+                f.write(self._NewLine(2) + "]")  # close rows 
+            elif key == "rows":
+                f.write("[]")  # no rows 
+            else:
+                f.write(self._Dumps(t[key], 2))  # scalar/list value 
+        f.write(self._NewLine(1) + "}")  # close table object 
+        self.Count += 1  # next table 
+
+    def Close(self):
+        if self.File.closed:
+            return  # already closed or aborted 
+        try:
+            if self.Layout != "ndjson":
+                self.File.write("\n]" if self.Count and self.Indent else "]")  # close array 
+            self.File.close()  # flush to disk 
+        except BaseException:
+            self.Abort()  # never publish a half-written file 
+            raise
+        os.replace(self.TempPath, self.Path)  # complete file replaces the previous one 
+        CountFile(self.Path)  # bytes + files counters 
+
+    def Abort(self):
+        self.File.close()  # release handle 
+        self.TempPath.unlink(missing_ok=True)  # drop partial output, the previous file stays 
+
+def WriteTablesJson(tables: Iterable[Dict[str, Any]], outputPath: Path, layout: str = "indented"):
+    writer = JsonTablesWriter(outputPath, layout)  # incremental writer 
+    try:
+        for t in tables:  # one table at a time 
+            writer.Write(t)  # append table 
+    except BaseException:
+        writer.Abort()  # e.g. a value json cannot encode 
+        raise
+    writer.Close()  # close array, publish file 
+
+def CsvFileName(t: Dict[str, Any]) -> str:
+    tableName = str(t["table_name"]).replace("/", "_").replace("\\", "_").replace(" ", "_")  # filename-safe name 
+    return f"{tableName}.csv"  # file name 
+
+def WriteCsvRows(f, t: Dict[str, Any]):
     import csv  # CSV writer 
+    t = ColumnarTable.From(t)  # work on columns 
+    writer = csv.writer(f)  # plain writer, no per-row key lookups 
+    writer.writerow(t.Header)  # header row 
+    writer.writerows(t.IterRowValues())  # rows straight from columns 
+
+def WriteTableCsv(t: Dict[str, Any], outDir: Path) -> Path:
+    csvPath = outDir / CsvFileName(t)  # target path 
+    with Stage("write_csv"), open(csvPath, "w", newline="", encoding="utf-8") as f:  # open file 
+        WriteCsvRows(f, t)  # header + rows 
+    CountFile(csvPath)  # bytes + files counters 
+    return csvPath  # written file 
+
+def WriteTablesCsv(tables: Iterable[Dict[str, Any]], outDir: Path):
+    outDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
     for t in tables:  # one CSV per table 
-        tableName = t["table_name"].replace("/", "_").replace("\\", "_").replace(" ", "_")  # filename-safe name 
-        csvPath = outDir / f"{tableName}.csv"  # target path 
-        header = t["header"]  # header order 
-        with open(csvPath, "w", newline="", encoding="utf-8") as f:  # open file 
-            writer = csv.DictWriter(f, fieldnames=header)  # writer with header 
-            writer.writeheader()  # header row 
-            for row in t["rows"]:  # each row 
-                writer.writerow(row)  # write row 
\ No newline at end of file
+        WriteTableCsv(t, outDir)  # write table 
@@ -0,0 +1,103 @@
+# instrumentation_module.py
+
+import json  # report
+import threading  # DDL writer / loader threads
+import time  # timers
+from contextlib import contextmanager, nullcontext  # stage blocks
+from pathlib import Path  # FS paths
+from typing import Any, Callable, Dict, Iterator, List, Optional  # typing
+
+Hook = Callable[[str, str, float], None]  # (kind, name, value): kind is "stage" (seconds) or "count" 
+
+_Active: Optional["Instrumentation"] = None  # current run, None = disabled 
+_NullStage = nullcontext()  # shared no-op block used when disabled 
+
+class Instrumentation:
+    def __init__(self, hooks: Optional[List[Hook]] = None):
+        self.Hooks: List[Hook] = list(hooks or [])  # user callbacks 
+        self.Timings: Dict[str, float] = {}  # stage → seconds 
+        self.Calls: Dict[str, int] = {}  # stage → times entered 
+        self.Counters: Dict[str, int] = {}  # counter → total 
+        self.Started = time.perf_counter()  # run start 
+        self.Lock = threading.Lock()  # stages and counters are updated from pool threads 
+
+    @contextmanager
+    def Stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()  # stage start 
+        try:
+            yield
+        finally:
+            self.AddTime(name, time.perf_counter() - t0)  # accumulate 
+
+    def AddTime(self, name: str, seconds: float):
+        with self.Lock:
+            self.Timings[name] = self.Timings.get(name, 0.0) + seconds  # accumulate 
+            self.Calls[name] = self.Calls.get(name, 0) + 1  # entries 
+        for hook in self.Hooks:
+            hook("stage", name, seconds)  # notify 
+
+    def Count(self, name: str, value: int = 1):
+        with self.Lock:
+            self.Counters[name] = self.Counters.get(name, 0) + value  # accumulate 
+        for hook in self.Hooks:
+            hook("count", name, value)  # notify 
+
+    def Merge(self, report: Dict[str, Any]):
+        for name, stage in report.get("stages", {}).items():  # another process's Report() 
+            with self.Lock:
+                self.Timings[name] = self.Timings.get(name, 0.0) + stage["seconds"]  # summed across processes 
+                self.Calls[name] = self.Calls.get(name, 0) + stage["calls"]  # entries 
+            for hook in self.Hooks:
+                hook("stage", name, stage["seconds"])  # notify 
+        for name, value in report.get("counters", {}).items():
+            self.Count(name, value)  # accumulate + notify 
+
+    def Report(self) -> Dict[str, Any]:
+        with self.Lock:
+            return {  # timing report 
+                "elapsed": round(time.perf_counter() - self.Started, 6),  # wall seconds 
+                "stages": {k: {"seconds": round(v, 6), "calls": self.Calls[k]} for k, v in sorted(self.Timings.items(), key=lambda kv: -kv[1])},  # slowest first 
+                "counters": dict(sorted(self.Counters.items())),  # totals 
+            }
+
+    def WriteReport(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.Report(), indent=2), encoding="utf-8")  # JSON report 
+        return path  # written file 
+
+def Current() -> Optional[Instrumentation]:
+    return _Active  # None when disabled 
+
+def Stage(name: str):
+    return _Active.Stage(name) if _Active is not None else _NullStage  # no-op when disabled 
+
+def Count(name: str, value: int = 1):
+    if _Active is not None:
+        _Active.Count(name, value)  # no-op when disabled 
+
+def CountFile(path: Path):
+    if _Active is not None:
+        _Active.Count("files_written")  # one more output file 
+        _Active.Count("bytes_written", Path(path).stat().st_size)  # size on disk, stat only when enabled 
+
+@contextmanager
+def Instrumented(reportDir: Optional[Path] = None, hooks: Optional[List[Hook]] = None, profile: bool = False) -> Iterator[Instrumentation]:
+    global _Active
+    previous = _Active  # allow nesting 
+    inst = Instrumentation(hooks)  # this run 
+    profiler = None  # optional cProfile capture 
+    if profile:
+        import cProfile  # lazy import 
+        profiler = cProfile.Profile()  # single-run profiler 
+        profiler.enable()  # start capture 
+    _Active = inst  # enable hooks in extractor/ddl modules 
+    try:
+        yield inst
+    finally:
+        _Active = previous  # disable 
+        if profiler is not None:
+            profiler.disable()  # stop capture 
+        if reportDir is not None:
+            reportDir.mkdir(parents=True, exist_ok=True)  # ensure folder 
+            inst.WriteReport(reportDir / "timings.json")  # report next to outputs 
+            if profiler is not None:
+                profiler.dump_stats(str(reportDir / "profile.prof"))  # open with pstats/snakeviz 
@@ -0,0 +1,227 @@
+# loader_module.py
+
+import queue  # idle connections
+import re  # type parsing
+import time  # per-table timings
+from concurrent.futures import ThreadPoolExecutor  # several tables at once
+from contextlib import contextmanager  # pooled connection blocks
+from datetime import date, datetime, time as dtime  # values SQLite cannot bind
+from itertools import islice, repeat  # batching, missing columns
+from pathlib import Path  # FS paths
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple  # typing
+from ddl_module import TableColumns, SanitizeIdentifier, SchemaForTable  # column definitions shared with the DDL
+from table_module import ColumnarTable  # compact table object
+from instrumentation_module import Stage, Count  # timing hooks, no-ops when disabled
+
+ConnectionFactory = Callable[[], Any]  # returns a new DB-API 2.0 connection 
+LoadModes = ("replace", "append")  # replace: drop and recreate each table, append: create if missing and add rows 
+
+class LoadTarget:
+    Placeholder = ":{}"  # Oracle-style numbered binds (cx_Oracle / python-oracledb) 
+
+    def MapType(self, dataType: str) -> str:
+        return dataType  # Oracle types as written in the spec 
+
+    def Quote(self, name: str) -> str:
+        return f'"{name}"'  # sanitized names are upper case, so quoting only shields reserved words (e.g. DATE, WHEN) 
+
+    def TableName(self, t: Dict[str, Any], schema: str) -> str:
+        return f"{self.Quote(schema)}.{self.Quote(SanitizeIdentifier(str(t['table_name'])))}"  # same name as the generated DDL 
+
+    def CreateTableSql(self, tableName: str, columns: List[Dict[str, Any]]) -> str:
+        lines = []  # column lines 
+        for c in columns:
+            defaultClause = f" DEFAULT {c['default']}" if c["default"] is not None else ""  # default clause 
+            nullClause = " NOT NULL" if c["not_null"] else ""  # nullability clause 
+            lines.append(f"  {self.Quote(c['name'])} {self.MapType(c['data_type'])}{defaultClause}{nullClause}")  # column line 
+        pkCols = [self.Quote(c["name"]) for c in columns if c["pk"]]  # PK columns 
+        if pkCols:
+            lines.append(f"  PRIMARY KEY ({', '.join(pkCols)})")  # inline PK constraint 
+        return f"CREATE TABLE {tableName} (\n" + ",\n".join(lines) + "\n)"  # single statement, no trailing ';' for DB-API 
+
+    def PrepareSql(self, tableName: str, columns: List[Dict[str, Any]], mode: str) -> List[str]:
+        create = self.CreateTableSql(tableName, columns)  # table from the spec 
+        if mode == "append":
+            return [_IgnoreOracleError(create, -955)]  # ORA-00955: keep the existing table 
+        return [_IgnoreOracleError(f"DROP TABLE {tableName} PURGE", -942), create]  # ORA-00942: nothing to drop on the first run 
+
+    def InsertSql(self, tableName: str, columns: List[Dict[str, Any]]) -> str:
+        names = ", ".join(self.Quote(c["name"]) for c in columns)  # column list 
+        binds = ", ".join(self.Placeholder.format(i) for i in range(1, len(columns) + 1))  # bind markers 
+        return f"INSERT INTO {tableName} ({names}) VALUES ({binds})"  # parameterized insert 
+
+    def ConvertValue(self, value: Any) -> Any:
+        return value  # driver binds Python values 
+
+    def Begin(self, conn):
+        pass  # DB-API connections open a transaction implicitly 
+
+class SqliteTarget(LoadTarget):
+    Placeholder = "?"  # qmark binds 
+
+    def MapType(self, dataType: str) -> str:
+        return OracleToSqliteType(dataType)  # type affinity 
+
+    def TableName(self, t: Dict[str, Any], schema: str) -> str:
+        return self.Quote(SanitizeIdentifier(str(t["table_name"])))  # SQLite has no schemas 
+
+    def PrepareSql(self, tableName: str, columns: List[Dict[str, Any]], mode: str) -> List[str]:
+        create = self.CreateTableSql(tableName, columns)  # table from the spec 
+        if mode == "append":
+            return [create.replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1)]  # keep the existing table and its rows 
+        return [f"DROP TABLE IF EXISTS {tableName}", create]  # transactional DDL: a failed load restores the old table 
+
+    def ConvertValue(self, value: Any) -> Any:
+        if value is None or isinstance(value, (int, float, str, bytes)):
+            return value  # native SQLite values (bool is an int) 
+        if isinstance(value, (datetime, date, dtime)):
+            return value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()  # ISO-8601 text 
+        return str(value)  # Decimal and anything else as text, NUMERIC affinity converts 
+
+    def Begin(self, conn):
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")  # take the write lock up front so concurrent loaders wait instead of failing 
+
+def _IgnoreOracleError(sql: str, code: int) -> str:
+    escaped = sql.replace("'", "''")  # statement as a PL/SQL string literal 
+    return f"BEGIN EXECUTE IMMEDIATE '{escaped}'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != {code} THEN RAISE; END IF; END;"  # Oracle has no IF [NOT] EXISTS before 23ai 
+
+def OracleToSqliteType(dataType: str) -> str:
+    t = " ".join(str(dataType).upper().split())  # normalized spelling 
+    base, _, args = t.partition("(")  # "DOUBLE PRECISION", "TIMESTAMP" + "6) WITH TIME ZONE", "NUMBER" + "10,2)" 
+    base = base.strip()  # base type name, multi-word names kept whole 
+    m = re.match(r"\s*(\*|\d+)?\s*(?:,\s*(-?\d+))?", args)  # precision/scale, qualifiers after ')' ignored 
+    precision, scale = m.group(1), m.group(2)  # NUMBER precision/scale 
+    if base in {"INTEGER", "INT", "SMALLINT", "PLS_INTEGER", "BINARY_INTEGER"}:
+        return "INTEGER"  # whole numbers 
+    if base in {"NUMBER", "NUMERIC", "DECIMAL", "DEC"}:
+        if scale == "0" or (precision not in (None, "*") and scale is None):
+            return "INTEGER"  # NUMBER(p) / NUMBER(p,0) 
+        return "NUMERIC"  # NUMBER / NUMBER(p,s) 
+    if base in {"FLOAT", "BINARY_FLOAT", "BINARY_DOUBLE", "REAL", "DOUBLE PRECISION"}:
+        return "REAL"  # floating point 
+    if base in {"BLOB", "RAW", "LONG RAW", "BFILE"}:
+        return "BLOB"  # binary 
+    return "TEXT"  # VARCHAR2/CHAR/CLOB/DATE/TIMESTAMP/... as text (dates in ISO-8601) 
+
+def SqliteConnect(dbPath: Path) -> ConnectionFactory:
+    import sqlite3  # lazy import 
+    def Connect():
+        return sqlite3.connect(str(dbPath), timeout=60, check_same_thread=False, isolation_level=None)  # pooled across threads, transactions opened explicitly 
+    return Connect  # connection factory 
+
+class ConnectionPool:
+    def __init__(self, connect: ConnectionFactory, size: int = 4):
+        self.Connect = connect  # connection factory 
+        self.Size = max(1, size)  # max open connections 
+        self.Idle: "queue.LifoQueue[Any]" = queue.LifoQueue()  # returned connections 
+        self.Opened: List[Any] = []  # every connection made 
+        self.Slots = queue.Queue()  # one token per connection that may still be opened 
+        for _ in range(self.Size):
+            self.Slots.put(None)  # free slot 
+
+    @contextmanager
+    def Connection(self) -> Iterator[Any]:
+        try:
+            conn = self.Idle.get_nowait()  # reuse an idle connection 
+        except queue.Empty:
+            try:
+                self.Slots.get_nowait()  # room for a new one 
+            except queue.Empty:
+                conn = self.Idle.get()  # wait for a connection to come back 
+            else:
+                try:
+                    conn = self.Connect()  # open lazily 
+                except Exception:
+                    self.Slots.put(None)  # failed connect frees its slot, later jobs may retry 
+                    raise
+                self.Opened.append(conn)  # remember for Close 
+        try:
+            yield conn
+        finally:
+            self.Idle.put(conn)  # back to the pool 
+
+    def Close(self):
+        for conn in self.Opened:
+            conn.close()  # release handles 
+        self.Opened = []  # nothing open 
+
+def RowsByTableName(dataTables: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {SanitizeIdentifier(str(t["table_name"])): t for t in dataTables}  # data tables keyed like the DDL names 
+
+def _RowTuples(columns: List[Dict[str, Any]], source: Any, convert: Callable[[Any], Any]) -> Iterator[Tuple[Any, ...]]:
+    if isinstance(source, Mapping) and "header" in source:
+        table = ColumnarTable.From(source)  # extracted data table 
+        keys, positions = table.RowLayout()  # dict-row semantics 
+        bySanitized = {SanitizeIdentifier(str(k)): table.Columns[p] for k, p in zip(keys, positions)}  # header label → values 
+        values = [bySanitized.get(c["name"]) for c in columns]  # spec column → data column 
+        values = [v if v is not None else repeat(None, table.RowCount()) for v in values]  # missing column → NULL 
+        for row in zip(*values):
+            yield tuple(convert(v) for v in row)  # bind values 
+        return
+    for row in source:
+        if isinstance(row, Mapping):
+            yield tuple(convert(row.get(c["raw_name"], row.get(c["name"]))) for c in columns)  # dict row by Excel or column name 
+        else:
+            row = list(row)[:len(columns)]  # sequence row in column order 
+            yield tuple(convert(v) for v in row + [None] * (len(columns) - len(row)))  # pad short rows 
+
+class BulkLoader:
+    def __init__(self, connect: ConnectionFactory, target: Optional[LoadTarget] = None, batchSize: int = 1000, poolSize: int = 4, mode: str = "replace"):
+        if mode not in LoadModes:
+            raise ValueError(f"mode must be one of {', '.join(LoadModes)}")  # unknown mode 
+        self.Pool = ConnectionPool(connect, poolSize)  # shared connections 
+        self.Target = target if target is not None else LoadTarget()  # SQL dialect 
+        self.BatchSize = max(1, batchSize)  # rows per executemany 
+        self.PoolSize = max(1, poolSize)  # tables loaded at once 
+        self.Mode = mode  # what a re-run does with existing tables 
+
+    def LoadTable(self, conn, spec: Dict[str, Any], rows: Any, schema: str) -> Dict[str, Any]:
+        columns = TableColumns(spec)  # same columns as GenerateTableDdl 
+        tableName = self.Target.TableName(spec, schema)  # target table 
+        result: Dict[str, Any] = {"table": SanitizeIdentifier(str(spec["table_name"])), "rows": 0, "seconds": 0.0, "error": None}  # load summary 
+        started = time.perf_counter()  # table timer 
+        cursor = conn.cursor()  # DB-API cursor 
+        try:
+            with Stage("load_table"):
+                self.Target.Begin(conn)  # explicit transaction 
+                for sql in self.Target.PrepareSql(tableName, columns, self.Mode):
+                    cursor.execute(sql)  # drop/create from the spec 
+                if rows is not None and columns:
+                    insertSql = self.Target.InsertSql(tableName, columns)  # parameterized insert 
+                    values = _RowTuples(columns, rows, self.Target.ConvertValue)  # bind tuples 
+                    while True:
+                        batch = list(islice(values, self.BatchSize))  # next batch 
+                        if not batch:
+                            break  # all rows sent 
+                        cursor.executemany(insertSql, batch)  # one round trip per batch 
+                        result["rows"] += len(batch)  # rows sent 
+                conn.commit()  # one transaction per table 
+            Count("rows_loaded", result["rows"])  # rows inserted 
+        except Exception as e:
+            conn.rollback()  # inserted rows; SQLite also undoes the DROP/CREATE, Oracle DDL has already committed 
+            result["rows"] = 0  # rolled back 
+            result["error"] = f"{type(e).__name__}: {e}"  # keep going with other tables 
+        finally:
+            cursor.close()  # release cursor 
+        result["seconds"] = round(time.perf_counter() - started, 6)  # seconds 
+        return result  # load summary 
+
+    def Load(self, tables: Iterable[Dict[str, Any]], rowsByTable: Optional[Mapping[str, Any]] = None, schemaBySheet: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        rowsByTable = rowsByTable or {}  # table name → rows 
+        schemaBySheet = schemaBySheet or {"": "MYSCHEMA"}  # schema map 
+        def Job(t: Dict[str, Any]) -> Dict[str, Any]:
+            rows = rowsByTable.get(str(t["table_name"]), rowsByTable.get(SanitizeIdentifier(str(t["table_name"]))))  # raw or DDL name 
+            try:
+                with self.Pool.Connection() as conn:
+                    return self.LoadTable(conn, t, rows, SchemaForTable(t, schemaBySheet))  # one table, one transaction 
+            except Exception as e:
+                return {"table": SanitizeIdentifier(str(t["table_name"])), "rows": 0, "seconds": 0.0, "error": f"{type(e).__name__}: {e}"}  # connect failed, report like a load error 
+        tables = list(tables)  # submission order 
+        if self.PoolSize == 1 or len(tables) < 2:
+            return [Job(t) for t in tables]  # serial 
+        with ThreadPoolExecutor(max_workers=self.PoolSize) as pool:  # one connection per worker 
+            return list(pool.map(Job, tables))  # input order 
+
+    def Close(self):
+        self.Pool.Close()  # close pooled connections 
@@ -0,0 +1,152 @@
+# session_module.py
+
+import threading  # GUI thread + run worker
+from collections import OrderedDict  # LRU order
+from pathlib import Path  # FS paths
+from typing import Any, Dict, Iterator, List, Optional, Tuple  # typing
+from openpyxl import load_workbook  # Excel reader
+
+WorkbookKey = Tuple[str, int, int]  # (resolved path, size, mtime_ns) 
+
+class CachedCell:
+    __slots__ = ("value",)  # same attribute as an openpyxl cell 
+
+    def __init__(self, value: Any):
+        self.value = value  # cell value 
+
+class CachedSheet:
+    def __init__(self, title: str, rows: List[Tuple[Any, ...]], excelPath: Path):
+        self.title = title  # sheet name 
+        self.Rows = rows  # values_only rows as read in read-only mode 
+        self.ExcelPath = excelPath  # source for merged ranges 
+        self.Cells = sum(len(r) for r in rows)  # LRU size unit 
+        self._MergedRanges: Optional[List[Tuple[int, int, int, int]]] = None  # read on first use 
+
+    @property
+    def max_row(self) -> int:
+        return len(self.Rows)  # last row 
+
+    @property
+    def max_column(self) -> int:
+        return max((len(r) for r in self.Rows), default=0)  # widest row 
+
+    def iter_rows(self, max_col: Optional[int] = None, values_only: bool = True) -> Iterator[Tuple[Any, ...]]:
+        if max_col is None:
+            return iter(self.Rows)  # rows as cached 
+        return (tuple(r[:max_col]) + (None,) * (max_col - len(r)) for r in self.Rows)  # fixed width 
+
+    def cell(self, row: int, column: int) -> CachedCell:
+        if 1 <= row <= len(self.Rows) and 1 <= column <= len(self.Rows[row - 1]):
+            return CachedCell(self.Rows[row - 1][column - 1])  # cached value 
+        return CachedCell(None)  # outside the used range 
+
+    @property
+    def MergedRanges(self) -> List[Tuple[int, int, int, int]]:
+        if self._MergedRanges is None:
+            from extractor_module import ReadMergedRanges  # lazy import 
+            workBook = load_workbook(self.ExcelPath, read_only=True)  # only when titles/fill need merges 
+            try:
+                self._MergedRanges = ReadMergedRanges(workBook[self.title])  # (minRow, minCol, maxRow, maxCol) 
+            finally:
+                workBook.close()  # release archive handle 
+        return self._MergedRanges  # merged ranges 
+
+class CachedWorkbook:
+    def __init__(self, session: "WorkbookSession", excelPath: Path):
+        self.Session = session  # owning session 
+        self.ExcelPath = excelPath  # source workbook 
+        self.Key = session.Key(excelPath)  # cache key for this run 
+        self.sheetnames = session.SheetNames(excelPath)  # workbook order 
+        self.Source = None  # read-only workbook, opened only for sheets not in memory 
+
+    def __getitem__(self, name: str) -> CachedSheet:
+        sheet = self.Session.Get(self.Key, name)  # parsed rows from an earlier run 
+        if sheet is None:
+            if self.Source is None:
+                self.Source = load_workbook(self.ExcelPath, read_only=True, data_only=True)  # streaming workbook with computed values 
+            sheet = CachedSheet(name, list(self.Source[name].iter_rows(values_only=True)), self.ExcelPath)  # parse once 
+            self.Session.Put(self.Key, name, sheet)  # keep for the next run 
+        return sheet  # worksheet-like view 
+
+    def close(self):
+        if self.Source is not None:
+            self.Source.close()  # release archive handle 
+            self.Source = None  # closed 
+
+class WorkbookSession:
+    def __init__(self, maxCells: int = 5_000_000):
+        self.MaxCells = maxCells  # LRU limit in cells across cached sheets 
+        self.Sheets: "OrderedDict[Tuple[WorkbookKey, str], CachedSheet]" = OrderedDict()  # least recently used first 
+        self.Names: Dict[WorkbookKey, List[str]] = {}  # sheet names per workbook version 
+        self.SheetFingerprints: Dict[WorkbookKey, Dict[str, str]] = {}  # incremental-cache fingerprints per workbook version 
+        self.Cells = 0  # cells held 
+        self.Lock = threading.Lock()  # Load Sheets (UI thread) vs Run (worker thread) 
+
+    def Key(self, excelPath: Path) -> WorkbookKey:
+        st = Path(excelPath).stat()  # current file state 
+        return str(Path(excelPath).resolve()), st.st_size, st.st_mtime_ns  # a saved workbook gets a new key 
+
+    def _DropStale(self, key: WorkbookKey):
+        for old in [k for k in self.Names if k[0] == key[0] and k != key]:
+            del self.Names[old]  # file changed on disk 
+        for old in [k for k in self.SheetFingerprints if k[0] == key[0] and k != key]:
+            del self.SheetFingerprints[old]  # fingerprints of the old version 
+        for k in [k for k in self.Sheets if k[0][0] == key[0] and k[0] != key]:
+            self.Cells -= self.Sheets.pop(k).Cells  # rows of the old version 
+
+    def SheetNames(self, excelPath: Path) -> List[str]:
+        key = self.Key(excelPath)  # current version 
+        with self.Lock:
+            self._DropStale(key)  # forget older versions of the file 
+            names = self.Names.get(key)  # cached names 
+        if names is None:
+            workBook = load_workbook(excelPath, read_only=True)  # names only 
+            try:
+                names = list(workBook.sheetnames)  # workbook order 
+            finally:
+                workBook.close()  # release archive handle 
+            with self.Lock:
+                self.Names[key] = names  # remember 
+        return list(names)  # copy for the caller 
+
+    def Fingerprints(self, excelPath: Path) -> Dict[str, str]:
+        key = self.Key(excelPath)  # current version 
+        with self.Lock:
+            self._DropStale(key)  # forget older versions of the file 
+            fingerprints = self.SheetFingerprints.get(key)  # cached fingerprints 
+        if fingerprints is None:
+            from cache_module import SheetFingerprints  # lazy import 
+            fingerprints = SheetFingerprints(excelPath)  # decompresses every sheet once per file version 
+            with self.Lock:
+                self.SheetFingerprints[key] = fingerprints  # remember 
+        return dict(fingerprints)  # copy for the caller 
+
+    def Get(self, key: WorkbookKey, name: str) -> Optional[CachedSheet]:
+        with self.Lock:
+            sheet = self.Sheets.get((key, name))  # cached rows 
+            if sheet is not None:
+                self.Sheets.move_to_end((key, name))  # most recently used 
+            return sheet
+
+    def Put(self, key: WorkbookKey, name: str, sheet: CachedSheet):
+        if sheet.Cells > self.MaxCells:
+            return  # larger than the whole budget, used for this run only 
+        with self.Lock:
+            old = self.Sheets.pop((key, name), None)  # replaced entry 
+            if old is not None:
+                self.Cells -= old.Cells  # release 
+            self.Sheets[(key, name)] = sheet  # newest 
+            self.Cells += sheet.Cells  # account 
+            while self.Cells > self.MaxCells:
+                _, evicted = self.Sheets.popitem(last=False)  # least recently used 
+                self.Cells -= evicted.Cells  # release 
+
+    def Open(self, excelPath: Path) -> CachedWorkbook:
+        return CachedWorkbook(self, Path(excelPath))  # workbook-like view backed by the cache 
+
+    def Clear(self):
+        with self.Lock:
+            self.Sheets.clear()  # drop rows 
+            self.Names.clear()  # drop names 
+            self.SheetFingerprints.clear()  # drop fingerprints 
+            self.Cells = 0  # empty 
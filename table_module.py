@@ -0,0 +1,130 @@
+# table_module.py
+
+from collections.abc import Mapping, Sequence  # read-only container protocols 
+from typing import Any, Dict, Iterator, List, Optional, Tuple  # typing 
+
+TableKeys = ("table_name", "header", "rows", "sheet", "start_cell")  # dict layout of a table object 
+PatternKey = "pattern"  # present only on tables found by a multi-pattern run 
+
+class TableRows(Sequence):
+    __slots__ = ("Table",)  # owning table only, rows are built on access 
+
+    def __init__(self, table: "ColumnarTable"):
+        self.Table = table  # owning table 
+
+    def __len__(self) -> int:
+        return self.Table.RowCount()  # number of data rows 
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]  # list of row dicts 
+        keys, positions = self.Table.RowLayout()  # unique keys + source columns 
+        columns = self.Table.Columns  # column lists 
+        return {k: columns[p][index] for k, p in zip(keys, positions)}  # header→value mapping 
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        keys, positions = self.Table.RowLayout()  # unique keys + source columns 
+        for values in zip(*(self.Table.Columns[p] for p in positions)):  # row-wise over columns 
+            yield dict(zip(keys, values))  # header→value mapping 
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, TableRows)):
+            return list(self) == list(other)  # compare as row dicts 
+        return NotImplemented  # unsupported comparison 
+
+    def __repr__(self) -> str:
+        return f"TableRows({len(self)} rows)"  # short repr 
+
+class ColumnarTable(Mapping):
+    __slots__ = ("TableName", "Header", "Columns", "Sheet", "StartCell", "Meta", "Pattern")  # header stored once, data column-wise 
+
+    def __init__(self, tableName: str, header: List[str], columns: Optional[List[List[Any]]] = None, sheet: str = "", startCell: Tuple[int, int] = (1, 1), meta: Optional[Dict[str, Any]] = None, pattern: Optional[List[str]] = None):
+        self.TableName = tableName  # table name 
+        self.Header = header  # header labels 
+        self.Columns = columns if columns is not None else [[] for _ in header]  # one value list per header cell 
+        self.Sheet = sheet  # source sheet 
+        self.StartCell = startCell  # header position (row, col) 1-based 
+        self.Meta = meta if meta is not None else {}  # extra keys (e.g. comments) 
+        self.Pattern = pattern  # header pattern that found the table, None for single-pattern runs 
+
+    @classmethod
+    def From(cls, t: Mapping) -> "ColumnarTable":
+        if isinstance(t, ColumnarTable):
+            return t  # already columnar 
+        rows = t.get("rows", [])  # row dicts 
+        header = list(t["header"]) if "header" in t else list(dict.fromkeys(k for r in rows for k in r))  # header labels, or row keys in first-seen order 
+        columns = [[r.get(h) for r in rows] for h in header]  # pivot rows to columns 
+        meta = {k: v for k, v in t.items() if k not in TableKeys and k != PatternKey}  # keep extra keys 
+        return cls(t["table_name"], header, columns, t.get("sheet", ""), t.get("start_cell", (1, 1)), meta, t.get(PatternKey))  # columnar copy 
+
+    def AppendRow(self, values: List[Any]):
+        for column, value in zip(self.Columns, values):  # one value per column 
+            column.append(value)  # store column-wise 
+
+    def RowCount(self) -> int:
+        return len(self.Columns[0]) if self.Columns else 0  # all columns share a length 
+
+    def RowLayout(self) -> Tuple[List[str], List[int]]:
+        lastIndex = {h: i for i, h in enumerate(self.Header)}  # duplicate labels: last column wins, like a dict row 
+        keys = list(lastIndex)  # first-occurrence key order 
+        return keys, [lastIndex[k] for k in keys]  # keys + source columns 
+
+    def HeaderPositions(self) -> List[int]:
+        lastIndex = {h: i for i, h in enumerate(self.Header)}  # duplicate labels: last column wins 
+        return [lastIndex[h] for h in self.Header]  # source column for each header cell 
+
+    def IterRowValues(self) -> Iterator[Tuple[Any, ...]]:
+        return zip(*(self.Columns[p] for p in self.HeaderPositions()))  # row tuples in header order 
+
+    def Column(self, name: str) -> Optional[List[Any]]:
+        keys, positions = self.RowLayout()  # dict-row semantics 
+        for k, p in zip(keys, positions):
+            if k == name:
+                return self.Columns[p]  # column values 
+        return None  # no such column 
+
+    def ToDict(self) -> Dict[str, Any]:
+        return {k: (list(v) if k == "rows" else v) for k, v in self.items()}  # plain dict table object 
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "table_name":
+            return self.TableName  # table name 
+        if key == "header":
+            return self.Header  # header labels 
+        if key == "rows":
+            return TableRows(self)  # dict-row view 
+        if key == "sheet":
+            return self.Sheet  # source sheet 
+        if key == "start_cell":
+            return self.StartCell  # header position 
+        if key == PatternKey and self.Pattern is not None:
+            return self.Pattern  # matched header pattern 
+        return self.Meta[key]  # extra key 
+
+    def __setitem__(self, key: str, value: Any):
+        if key == "table_name":
+            self.TableName = value  # table name 
+        elif key == "header":
+            self.Header = value  # header labels 
+        elif key == "rows":
+            self.Columns = ColumnarTable.From({"table_name": self.TableName, "header": self.Header, "rows": value}).Columns  # pivot rows 
+        elif key == "sheet":
+            self.Sheet = value  # source sheet 
+        elif key == "start_cell":
+            self.StartCell = value  # header position 
+        elif key == PatternKey:
+            self.Pattern = value  # matched header pattern 
+        else:
+            self.Meta[key] = value  # extra key 
+
+    def __iter__(self) -> Iterator[str]:
+        yield from TableKeys  # core keys in dict order 
+        if self.Pattern is not None:
+            yield PatternKey  # matched header pattern 
+        yield from self.Meta  # extra keys 
+
+    def __len__(self) -> int:
+        return len(TableKeys) + (self.Pattern is not None) + len(self.Meta)  # key count 
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable({self.TableName!r}, {len(self.Header)} columns, {self.RowCount()} rows)"  # short repr 
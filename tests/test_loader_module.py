@@ -0,0 +1,108 @@
+# test_loader_module.py
+
+import sqlite3  # direct checks on the loaded database
+import sys  # import path
+import tempfile  # scratch databases
+import threading  # hang guard
+import unittest  # stdlib runner
+from pathlib import Path  # FS paths
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # modules live at the repo root 
+
+from loader_module import BulkLoader, OracleToSqliteType, SqliteConnect, SqliteTarget  # under test
+
+def Spec(name: str, columns, pk=()):
+    return {"table_name": name, "header": ["COLUMN NAME", "DATA TYPE", "PK"], "rows": [{"COLUMN NAME": c, "DATA TYPE": t, "PK": "Y" if c in pk else None} for c, t in columns]}  # spec table as extracted 
+
+class OracleToSqliteTypeTests(unittest.TestCase):
+    def test_type_mapping(self):
+        cases = {
+            "NUMBER": "NUMERIC", "NUMBER(10)": "INTEGER", "NUMBER(10, 2)": "NUMERIC", "NUMBER(*,0)": "INTEGER", "number ( 5 , 0 )": "INTEGER",
+            "INTEGER": "INTEGER", "FLOAT(126)": "REAL", "BINARY_DOUBLE": "REAL", "DOUBLE PRECISION": "REAL", "double  precision": "REAL",
+            "BLOB": "BLOB", "RAW(16)": "BLOB", "LONG RAW": "BLOB", "VARCHAR2(20 CHAR)": "TEXT", "CLOB": "TEXT", "DATE": "TEXT",
+            "TIMESTAMP(6) WITH TIME ZONE": "TEXT", "INTERVAL DAY(2) TO SECOND(6)": "TEXT",
+        }
+        self.assertEqual({t: OracleToSqliteType(t) for t in cases}, cases)
+
+class BulkLoaderTests(unittest.TestCase):
+    def setUp(self):
+        self.Dir = tempfile.TemporaryDirectory()  # scratch folder 
+        self.DbPath = Path(self.Dir.name) / "load.sqlite"  # target database 
+
+    def tearDown(self):
+        self.Dir.cleanup()  # remove scratch files 
+
+    def Query(self, sql: str):
+        conn = sqlite3.connect(str(self.DbPath))  # independent connection 
+        try:
+            return conn.execute(sql).fetchall()  # result rows 
+        finally:
+            conn.close()  # release handle 
+
+    def Load(self, specs, data, **kwargs):
+        loader = BulkLoader(SqliteConnect(self.DbPath), SqliteTarget(), **kwargs)  # SQLite loader 
+        try:
+            return loader.Load(specs, data)  # per-table results 
+        finally:
+            loader.Close()  # close pooled connections 
+
+    def test_commit_per_table(self):
+        specs = [Spec("T1", [("ID", "NUMBER(10)"), ("NAME", "VARCHAR2(20)")], pk=("ID",)), Spec("T2", [("WHEN", "DATE")])]  # reserved word column 
+        data = {"T1": [(i, f"n{i}") for i in range(2500)], "T2": [{"WHEN": "2024-01-01"}]}  # sequence and dict rows 
+        results = self.Load(specs, data, batchSize=1000, poolSize=2)
+        self.assertEqual([(r["table"], r["rows"], r["error"]) for r in results], [("T1", 2500, None), ("T2", 1, None)])
+        self.assertEqual(self.Query("SELECT COUNT(*), MAX(ID) FROM T1"), [(2500, 2499)])
+        self.assertEqual(self.Query('SELECT "WHEN" FROM T2'), [("2024-01-01",)])
+
+    def test_failed_table_is_rolled_back(self):
+        specs = [Spec("BAD", [("ID", "NUMBER(10)")], pk=("ID",)), Spec("GOOD", [("ID", "NUMBER(10)")])]  # duplicate key in BAD 
+        results = self.Load(specs, {"BAD": [(1,), (2,), (1,)], "GOOD": [(1,), (2,)]}, batchSize=1, poolSize=2)
+        self.assertEqual(results[0]["rows"], 0)
+        self.assertIn("IntegrityError", results[0]["error"])
+        self.assertEqual(results[1]["error"], None)
+        self.assertEqual(self.Query("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"), [("GOOD",)])  # BAD created and inserted in one transaction 
+        self.assertEqual(self.Query("SELECT COUNT(*) FROM GOOD"), [(2,)])
+
+    def test_rerun_replaces_by_default(self):
+        specs = [Spec("T1", [("ID", "NUMBER(10)")]), Spec("T2", [("ID", "NUMBER(10)")], pk=("ID",))]  # with and without PK 
+        data = {"T1": [(i,) for i in range(2500)], "T2": [(i,) for i in range(10)]}
+        for _ in range(2):
+            results = self.Load(specs, data)
+            self.assertEqual([r["error"] for r in results], [None, None])
+        self.assertEqual(self.Query("SELECT (SELECT COUNT(*) FROM T1), (SELECT COUNT(*) FROM T2)"), [(2500, 10)])
+
+    def test_rerun_append_adds_rows(self):
+        specs = [Spec("T1", [("ID", "NUMBER(10)")])]
+        for _ in range(2):
+            results = self.Load(specs, {"T1": [(i,) for i in range(2500)]}, mode="append")
+            self.assertEqual(results[0]["error"], None)
+        self.assertEqual(self.Query("SELECT COUNT(*) FROM T1"), [(5000,)])
+
+    def test_failed_replace_keeps_previous_table(self):
+        specs = [Spec("T1", [("ID", "NUMBER(10)")], pk=("ID",))]
+        self.Load(specs, {"T1": [(1,), (2,)]})
+        results = self.Load(specs, {"T1": [(3,), (3,)]})  # duplicate key on the second run 
+        self.assertIn("IntegrityError", results[0]["error"])
+        self.assertEqual(self.Query("SELECT ID FROM T1 ORDER BY ID"), [(1,), (2,)])  # DROP rolled back with the inserts 
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            BulkLoader(SqliteConnect(self.DbPath), SqliteTarget(), mode="upsert")
+
+    def test_connect_failure_is_reported_per_table(self):
+        def Connect():
+            raise sqlite3.OperationalError("unable to open database file")  # every connect fails 
+        specs = [Spec(f"T{i}", [("ID", "NUMBER(10)")]) for i in range(5)]  # more tables than pool slots 
+        results = []  # filled by the loader thread 
+        def Run():
+            loader = BulkLoader(Connect, SqliteTarget(), poolSize=2)  # pool of two failing slots 
+            results.extend(loader.Load(specs, {}))
+        worker = threading.Thread(target=Run, daemon=True)  # a blocked pool must not hang the suite 
+        worker.start()
+        worker.join(10)
+        self.assertFalse(worker.is_alive(), "Load blocked after failed connects")
+        self.assertEqual([r["table"] for r in results], [f"T{i}" for i in range(5)])
+        self.assertTrue(all("unable to open database file" in r["error"] and r["rows"] == 0 for r in results))
+
+if __name__ == "__main__":
+    unittest.main()